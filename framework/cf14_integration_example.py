@@ -7,6 +7,16 @@ Demonstrates how to integrate component tracking with CF14 operations
 from semantic_component_tracker import SemanticComponentTracker, ComponentState
 from datetime import datetime
 import json
+import re
+
+# Interpretation rewrites, applied in a single scan per cell
+_INTERP_MAP = {
+    "Values": "Core Values",
+    "Actions": "Key Actions",
+    "Principles": "Guiding Principles",
+    "Methods": "Practical Methods",
+}
+_INTERP_PATTERN = re.compile("|".join(map(re.escape, _INTERP_MAP)))
 
 class CF14WithTracking:
     """Enhanced CF14 execution with semantic component tracking"""
@@ -186,8 +196,7 @@ class CF14WithTracking:
             result_row = []
             for content in row:
                 # Simulate interpretation - make more user-friendly
-                interpreted = content.replace("Values", "Core Values").replace("Actions", "Key Actions")
-                interpreted = interpreted.replace("Principles", "Guiding Principles").replace("Methods", "Practical Methods")
+                interpreted = _INTERP_PATTERN.sub(lambda m: _INTERP_MAP[m.group(0)], content)
                 result_row.append(f"User-Friendly: {interpreted}")
             result.append(result_row)
         return result
@@ -191,13 +191,12 @@ def run_pipeline(args):
                     matrices_dict[name] = matrix_2d
                 
                 # Use CLI-provided Neo4j connection details
-                exporter = CF14Neo4jExporter(
+                with CF14Neo4jExporter(
                     uri=args.neo4j_uri,
                     user=args.neo4j_user,
                     password=args.neo4j_password,
-                )
-                exporter.export(matrices_dict, args.thread)
-                exporter.close()
+                ) as exporter:
+                    exporter.export(matrices_dict, args.thread)
                 print(f"  ✅ CF14 matrices exported to Neo4j (labels: CFMatrix, CFNode)")
         except Exception as e:
             print(f"  CF14 Neo4j export failed: {e}")
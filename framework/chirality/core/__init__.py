@@ -4,6 +4,7 @@ Core CF14 framework modules.
 
 from .types import Cell, Matrix, Tensor, Station, Operation
 from .ops import EchoResolver, OpenAIResolver, op_multiply, op_interpret, op_elementwise, op_add, op_cross
+from .cache import PromptCache
 from .serialize import load_matrix, save_matrix
 from .validate import CF14ValidationError
 from .ids import generate_cell_id, generate_matrix_id, generate_operation_id
@@ -12,7 +13,7 @@ __all__ = [
     # Core types
     "Cell", "Matrix", "Tensor", "Station", "Operation",
     # Operations
-    "EchoResolver", "OpenAIResolver", 
+    "EchoResolver", "OpenAIResolver", "PromptCache",
     "op_multiply", "op_interpret", "op_elementwise", "op_add", "op_cross",
     # Serialization
     "load_matrix", "save_matrix",
@@ -0,0 +1,24 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled grid builder for EchoResolver's deterministic pass-through path.
+
+Built only when CF14_ENABLE_CYTHON=1 (see setup.py); ops.py falls back to
+an equivalent pure-Python comprehension when this module is absent.
+"""
+
+
+cpdef list echo_grid(list heads, list tails):
+    """Return [[head + tail for tail in tails] for head in heads]."""
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t n_rows = len(heads)
+    cdef Py_ssize_t n_cols = len(tails)
+    cdef list grid = [None] * n_rows
+    cdef list row
+    cdef str head
+    for i in range(n_rows):
+        head = <str>heads[i]
+        row = [None] * n_cols
+        for j in range(n_cols):
+            row[j] = head + <str>tails[j]
+        grid[i] = row
+    return grid
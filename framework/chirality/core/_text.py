@@ -0,0 +1,54 @@
+"""
+Shared text normalization for CF14 hashing and prompt construction.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+_WS_RE = re.compile(r"\s+")
+_ws_sub = _WS_RE.sub
+_nfkc = unicodedata.normalize
+
+
+@lru_cache(maxsize=4096)
+def _normalize_str(s: str) -> str:
+    return _ws_sub(" ", _nfkc("NFKC", s)).strip()
+
+
+def normalize_text(s: str) -> str:
+    """Normalize unicode to NFKC and collapse whitespace."""
+    if s is None:
+        return ""
+    return _normalize_str(str(s))
+
+
+# The escapes json.dumps(s, ensure_ascii=False) applies inside a string literal
+_JSON_ESCAPE = {c: f"\\u{c:04x}" for c in range(0x20)}
+_JSON_ESCAPE.update({
+    ord("\\"): "\\\\",
+    ord('"'): '\\"',
+    ord("\b"): "\\b",
+    ord("\f"): "\\f",
+    ord("\n"): "\\n",
+    ord("\r"): "\\r",
+    ord("\t"): "\\t",
+})
+
+
+def escape_json_string(s: str) -> str:
+    """Escape text for embedding between double quotes, as JSON would."""
+    return s.translate(_JSON_ESCAPE)
+
+
+# ASCII text without control characters, quotes, backslashes, or leading,
+# trailing or doubled spaces is unchanged by normalization and escaping
+_NEEDS_WORK = re.compile(r'[\x00-\x1f"\\]|  |^ | $')
+_needs_work = _NEEDS_WORK.search
+
+
+def normalize_and_escape(s: str) -> str:
+    """Normalize text and escape it for embedding between double quotes."""
+    if type(s) is str and s.isascii() and not _needs_work(s):
+        return s  # Already canonical (IDs, ontology labels, ...)
+    return escape_json_string(normalize_text(s))
@@ -0,0 +1,98 @@
+"""
+Response cache for CF14 semantic operations.
+
+Keyed by prompt_hash, so identical (system, user, context) prompts are only
+sent to the LLM once. An in-memory LRU tier can be backed by a directory of
+JSON files that survives across runs.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+class PromptCache:
+    """
+    Two-tier LRU cache of LLM responses keyed by prompt hash.
+    
+    Safe to share between the worker threads of a concurrent matrix sweep.
+    """
+    
+    def __init__(self, maxsize: int = 10_000, directory: Optional[Union[str, Path]] = None):
+        """
+        Initialize cache.
+        
+        Args:
+            maxsize: Maximum entries held in memory
+            directory: Optional directory for the persistent tier
+        """
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a deep copy of the cached response for key, or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return deepcopy(value)
+        
+        value = self._read_disk(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, value)
+        return deepcopy(value)
+    
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a deep copy of a response under key in both tiers."""
+        # Responses carry lists (terms_used, warnings); share none with callers
+        value = deepcopy(value)
+        with self._lock:
+            self._remember(key, value)
+        self._write_disk(key, value)
+    
+    def clear(self) -> None:
+        """Drop the in-memory tier (the persistent tier is left in place)."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _remember(self, key: str, value: Dict[str, Any]) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.directory is None:
+            return None
+        try:
+            with open(self.directory / f"{key}.json", "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_disk(self, key: str, value: Dict[str, Any]) -> None:
+        if self.directory is None:
+            return
+        path = self.directory / f"{key}.json"
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(value, f, ensure_ascii=False)
+        os.replace(tmp, path)  # Atomic, so readers never see a partial file
@@ -9,8 +9,6 @@ import os
 import json
 import time
 import hashlib
-import unicodedata
-import re
 from typing import Dict, Any, List, Optional, Literal
 from datetime import datetime
 
@@ -20,26 +18,21 @@ except Exception:
     OpenAI = None  # Defer hard failure until actually instantiated
 
 from .types import Cell, Matrix
-
-
-def normalize_text(s: str) -> str:
-    """Normalize unicode and whitespace for consistent processing."""
-    if s is None:
-        return ""
-    s = unicodedata.normalize("NFKC", str(s))
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+from .cache import PromptCache
+from .provenance import prompt_hash
+from ._text import normalize_and_escape
 
 
 def escape_for_prompt(s: str) -> str:
     """Escape string for safe embedding in prompts."""
-    return json.dumps(normalize_text(s), ensure_ascii=False)[1:-1]
+    return normalize_and_escape(s)
 
 
 class CellResolver:
     """Handles semantic operations on individual matrix cells."""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o",
+                 cache: Optional[PromptCache] = None):
         if OpenAI is None:
             raise ImportError("OpenAI package required. Install with: pip install openai")
 
@@ -49,6 +42,7 @@ class CellResolver:
         
         self.client = OpenAI(api_key=api_key)
         self.model = model
+        self.cache = cache
         
         # Temperature settings for different operations
         self.temperatures = {
@@ -211,6 +205,17 @@ Output JSON ONLY (no extra text):
         system_prompt = self._get_system_prompt()
         temperature = self.temperatures.get(operation, 0.5)
         
+        # Model and temperature are part of the key so responses never cross models
+        cache = self.cache
+        cache_key = None
+        if cache is not None:
+            cache_key = prompt_hash(system_prompt, user_prompt, {
+                "model": self.model, "temperature": temperature, "operation": operation
+            })
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         for attempt in range(max_retries):
             try:
                 response = self.client.chat.completions.create(
@@ -240,6 +245,8 @@ Output JSON ONLY (no extra text):
                         if key not in result:
                             result[key] = [] if key in ["terms_used", "warnings"] else ""
                     
+                    if cache is not None and cache_key is not None:
+                        cache.put(cache_key, result)
                     return result
                     
                 except json.JSONDecodeError as e:
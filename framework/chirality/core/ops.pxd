@@ -0,0 +1,26 @@
+# Augmenting declarations for an optional Cython build of ops.py.
+#
+# The .py module stays the single source of truth; these declarations only
+# add C-typed loop indices when the package is built with
+# CF14_ENABLE_CYTHON=1 (see setup.py). Functions that contain closures or
+# generator expressions cannot be cpdef and are left untouched. Arguments
+# stay untyped: a typed str/list argument would reject subclasses such as
+# MatrixType members, changing the API of the compiled module.
+
+cimport cython
+
+
+@cython.locals(rows=Py_ssize_t, cols=Py_ssize_t, r=Py_ssize_t, c=Py_ssize_t)
+cpdef _build_output_matrix(thread, name, station, values)
+
+@cython.locals(rows=Py_ssize_t, cols=Py_ssize_t, i=Py_ssize_t, j=Py_ssize_t, k=Py_ssize_t)
+cpdef _op_multiply_cell_by_cell(thread, A, B, cell_resolver)
+
+@cython.locals(rows=Py_ssize_t, cols=Py_ssize_t, i=Py_ssize_t, j=Py_ssize_t)
+cpdef _op_interpret_cell_by_cell(thread, B, cell_resolver)
+
+@cython.locals(rows=Py_ssize_t, cols=Py_ssize_t, i=Py_ssize_t, j=Py_ssize_t)
+cpdef _op_elementwise_cell_by_cell(thread, J, C, cell_resolver)
+
+@cython.locals(rows=Py_ssize_t, cols=Py_ssize_t, i=Py_ssize_t, j=Py_ssize_t)
+cpdef _op_add_cell_by_cell(thread, A, F, cell_resolver)
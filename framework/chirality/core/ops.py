@@ -16,15 +16,24 @@ import hashlib
 import unicodedata
 import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Tuple, Literal, Protocol, Callable
 from datetime import datetime
 
 from .types import Cell, Matrix, MatrixType, Operation
+from .cache import PromptCache
 from .ids import generate_cell_id, generate_operation_id, generate_matrix_id
 
 
 # Import provenance helpers
-from .provenance import canonical_value, prompt_hash, content_hash
+from .provenance import canonical_value, prompt_hash
+
+try:
+    from ._echo import echo_grid as _echo_grid  # type: ignore  # optional compiled build
+except ImportError:
+    def _echo_grid(heads: List[str], tails: List[str]) -> List[List[str]]:
+        """Concatenate every row head with every column tail."""
+        return [[head + tail for tail in tails] for head in heads]
 
 # ---------- Resolver Protocol ----------
 
@@ -56,50 +65,40 @@ class EchoResolver:
                 inputs: List[Matrix], system_prompt: str, user_prompt: str, 
                 context: Dict[str, Any]) -> List[List[str]]:
         """Return deterministic 2D array based on operation type."""
-        rows: int = 0
-        cols: int = 0
-        def _uninit(_r: int, _c: int) -> str:
-            raise RuntimeError("uninitialized op")
-        val: Callable[[int, int], str] = _uninit
-
+        # Rows are built directly as lists of str, so callers never need a
+        # per-cell type check; where a label splits into row/col halves the
+        # halves are formatted once and concatenated.
         if op == "*":
             A, B = inputs
-            rows, cols = A.shape[0], B.shape[1]
-            def _val(r: int, c: int) -> str:
-                return f"*:{A.name}[{r},:]{B.name}[:,{c}]"
-            val = _val
+            heads = [f"*:{A.name}[{r},:]{B.name}[:," for r in range(A.shape[0])]
+            tails = [f"{c}]" for c in range(B.shape[1])]
+            return _echo_grid(heads, tails)
         elif op == "+":
             A, F = inputs
             rows, cols = A.shape
-            def _val(r: int, c: int) -> str:
-                return f"+:{A.name}[{r},{c}]⊕{F.name}[{r},{c}]"
-            val = _val
+            return [[f"+:{A.name}[{r},{c}]⊕{F.name}[{r},{c}]" for c in range(cols)] for r in range(rows)]
         elif op == "interpret":
             (B,) = inputs
             rows, cols = B.shape
-            def _val(r: int, c: int) -> str:
-                return f"interp:{B.name}[{r},{c}]"
-            val = _val
+            heads = [f"interp:{B.name}[{r}," for r in range(rows)]
+            tails = [f"{c}]" for c in range(cols)]
+            return _echo_grid(heads, tails)
         elif op == "⊙":
             J, C = inputs
             rows, cols = J.shape
-            def _val(r: int, c: int) -> str:
-                return f"⊙:{J.name}[{r},{c}]×{C.name}[{r},{c}]"
-            val = _val
+            return [[f"⊙:{J.name}[{r},{c}]×{C.name}[{r},{c}]" for c in range(cols)] for r in range(rows)]
         elif op == "×":
             A, B = inputs
-            rows = A.shape[0] * B.shape[0]
-            cols = A.shape[1] * B.shape[1]
-            def _val(r: int, c: int) -> str:
-                ar, ac = r // B.shape[0], c // B.shape[1]
-                br, bc = r % B.shape[0], c % B.shape[1]
-                return f"×:{A.name}[{ar},{ac}]⨂{B.name}[{br},{bc}]"
-            val = _val
+            b_rows, b_cols = B.shape
+            rows = A.shape[0] * b_rows
+            cols = A.shape[1] * b_cols
+            return [
+                [f"×:{A.name}[{r // b_rows},{c // b_cols}]⨂{B.name}[{r % b_rows},{c % b_cols}]" for c in range(cols)]
+                for r in range(rows)
+            ]
         else:
             raise ValueError(f"Unknown op: {op}")
 
-        return [[val(r, c) for c in range(cols)] for r in range(rows)]
-
 
 def _ensure_grid(result: dict) -> List[List[str]]:
     """Validate JSON response and extract 2D grid with strict CF14 validation."""
@@ -125,8 +124,9 @@ class OpenAIResolver:
     as a final assertion.
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o", *, seed: int = 42):
-        """Initialize OpenAI resolver."""
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4o", *, seed: int = 42,
+                 cache: Optional[PromptCache] = None):
+        """Initialize OpenAI resolver (cache is handed to the cell-by-cell resolvers)."""
         try:
             from openai import OpenAI  # type: ignore
         except ImportError:
@@ -139,6 +139,7 @@ class OpenAIResolver:
         self.client = OpenAI(api_key=api_key)
         self.model = model
         self.seed = seed
+        self.cache = cache
         # keep temps low for dev reproducibility
         self.temperatures = {"*": 0.0, "+": 0.0, "interpret": 0.0, "⊙": 0.0, "×": 0.0}
 
@@ -341,16 +342,12 @@ def _build_output_matrix(thread: str, name: str, station: str, values: List[List
                 value=value
             ))
     
-    # Calculate matrix hash
-    matrix_hash = content_hash(cells)
-    
     return Matrix(
         id=mid,
         name=name,
         station=station,
         shape=(rows, cols),
         cells=cells,
-        hash=matrix_hash,
         metadata={"timestamp": datetime.utcnow().isoformat()}
     )
 
@@ -376,6 +373,53 @@ def _op_record(kind: Literal["*", "+", "×", "interpret", "⊙"],
         output_hash=output.hash
     )
 
+# ---------- Cell-level call dispatch ----------
+
+def _max_concurrency() -> int:
+    """Concurrent cell-level LLM calls allowed (CF14_MAX_CONCURRENCY, default 8)."""
+    try:
+        return max(1, int(os.getenv("CF14_MAX_CONCURRENCY", "8")))
+    except ValueError:
+        return 8
+
+def _call_size(kwargs: Dict[str, Any]) -> int:
+    """Input text length of a cell call; longer inputs yield longer responses."""
+    size = 0
+    for value in kwargs.values():
+        if isinstance(value, str):
+            size += len(value)
+        elif isinstance(value, list):
+            size += sum(len(v) for v in value if isinstance(v, str))
+    return size
+
+def _run_cell_calls(calls: List[Tuple[Callable[..., Dict[str, Any]], Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Run independent cell resolver calls on a bounded thread pool.
+    
+    Each call is a (method, kwargs) pair. Results come back in submission
+    order, so callers can zip them with their own bookkeeping. Every call in a
+    batch is the same kind of operation, so they share one prompt prefix and a
+    similar response length; within the batch the longest inputs are started
+    first so no short call is left waiting behind a long straggler at the end.
+    """
+    workers = min(_max_concurrency(), len(calls))
+    if workers <= 1:
+        return [fn(**kwargs) for fn, kwargs in calls]
+    sizes = [_call_size(kwargs) for _, kwargs in calls]
+    order = sorted(range(len(calls)), key=sizes.__getitem__, reverse=True)
+    results: List[Dict[str, Any]] = [{}] * len(calls)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [(idx, pool.submit(calls[idx][0], **calls[idx][1])) for idx in order]
+        try:
+            for idx, future in futures:
+                results[idx] = future.result()
+        except BaseException:
+            # Stop at the first failure: queued LLM calls would be billed and discarded
+            for _, future in futures:
+                future.cancel()
+            raise
+    return results
+
 # ---------- Public Op Functions ----------
 
 def op_multiply(thread: str, A: Matrix, B: Matrix, resolver: Resolver) -> Tuple[Matrix, Operation]:
@@ -389,7 +433,7 @@ def op_multiply(thread: str, A: Matrix, B: Matrix, resolver: Resolver) -> Tuple[
     if hasattr(resolver, 'client'):  # This is an OpenAI resolver
         try:
             from .cell_resolver import CellResolver
-            cell_resolver = CellResolver(model=getattr(resolver, 'model', 'gpt-4o'))
+            cell_resolver = CellResolver(model=getattr(resolver, 'model', 'gpt-4o'), cache=getattr(resolver, 'cache', None))
             return _op_multiply_cell_by_cell(thread, A, B, cell_resolver)
         except Exception as e:
             # If OpenAI isn't available, fall back to echo-like path with clear note
@@ -421,48 +465,56 @@ def _op_multiply_cell_by_cell(thread: str, A: Matrix, B: Matrix, cell_resolver:
     for cell in B.cells:
         b_cells[(cell.row, cell.col)] = cell.value
     
-    result_cells = []
-    products_log = []
-    
-    # For each cell in the result matrix C
+    # Phase 1: every term product A[i,k] * B[k,j], resolved concurrently
+    mult_keys = []
+    mult_calls = []
     for i in range(rows):
         for j in range(cols):
-            # Collect products for this cell: A[i,k] * B[k,j] for all k
-            products = []
-            
             for k in range(A.shape[1]):  # A.cols == B.rows
                 term_a = a_cells.get((i, k), "")
                 term_b = b_cells.get((k, j), "")
                 
                 if term_a and term_b:
-                    # Semantic multiplication of individual terms
-                    mult_result = cell_resolver.multiply_terms(
-                        term_a=term_a,
-                        term_b=term_b,
-                        station="requirements",
-                        row_label=f"row_{i}",
-                        col_label=f"col_{j}"
-                    )
-                    
-                    if mult_result.get("text"):
-                        products.append(mult_result["text"])
-                        products_log.append({
-                            "cell": (i, j, k),
-                            "terms": (term_a, term_b),
-                            "result": mult_result["text"]
-                        })
-            
-            # Semantic addition of all products for this cell
-            if products:
-                add_result = cell_resolver.add_terms(
-                    products=products,
-                    station="requirements", 
-                    row_label=f"row_{i}",
-                    col_label=f"col_{j}"
-                )
-                final_text = add_result.get("text", "")
-            else:
-                final_text = ""
+                    mult_keys.append((i, j, k, term_a, term_b))
+                    mult_calls.append((cell_resolver.multiply_terms, {
+                        "term_a": term_a,
+                        "term_b": term_b,
+                        "station": "requirements",
+                        "row_label": f"row_{i}",
+                        "col_label": f"col_{j}"
+                    }))
+    
+    products: Dict[Tuple[int, int], List[str]] = {}
+    products_log = []
+    for key, mult_result in zip(mult_keys, _run_cell_calls(mult_calls)):
+        if mult_result.get("text"):
+            i, j, k, term_a, term_b = key
+            products.setdefault((i, j), []).append(mult_result["text"])
+            products_log.append({
+                "cell": (i, j, k),
+                "terms": (term_a, term_b),
+                "result": mult_result["text"]
+            })
+    
+    # Phase 2: semantic addition of each cell's products, resolved concurrently
+    add_keys = list(products)
+    add_calls = [
+        (cell_resolver.add_terms, {
+            "products": products[pos],
+            "station": "requirements",
+            "row_label": f"row_{pos[0]}",
+            "col_label": f"col_{pos[1]}"
+        })
+        for pos in add_keys
+    ]
+    final_texts = {}
+    for pos, add_result in zip(add_keys, _run_cell_calls(add_calls)):
+        final_texts[pos] = add_result.get("text", "")
+    
+    result_cells = []
+    for i in range(rows):
+        for j in range(cols):
+            final_text = final_texts.get((i, j), "")
             
             # Create result cell
             cid = cell_id(f"{thread}:C:v1", i, j, final_text)
@@ -474,14 +526,12 @@ def _op_multiply_cell_by_cell(thread: str, A: Matrix, B: Matrix, cell_resolver:
             ))
     
     # Build result matrix
-    matrix_hash = content_hash(result_cells)
     C = Matrix(
         id=matrix_id(thread, "C", 1),
         name="C",
         station="requirements",
         shape=(rows, cols),
         cells=result_cells,
-        hash=matrix_hash,
         metadata={
             "timestamp": datetime.utcnow().isoformat(),
             "cell_operations": len(products_log)
@@ -506,7 +556,7 @@ def op_interpret(thread: str, B: Matrix, resolver: Resolver) -> Tuple[Matrix, Op
     if hasattr(resolver, 'client'):  # This is an OpenAI resolver
         try:
             from .cell_resolver import CellResolver
-            cell_resolver = CellResolver(model=getattr(resolver, 'model', 'gpt-4o'))
+            cell_resolver = CellResolver(model=getattr(resolver, 'model', 'gpt-4o'), cache=getattr(resolver, 'cache', None))
             return _op_interpret_cell_by_cell(thread, B, cell_resolver)
         except Exception:
             pass
@@ -532,24 +582,29 @@ def _op_interpret_cell_by_cell(thread: str, B: Matrix, cell_resolver: _CellResol
     for cell in B.cells:
         b_cells[(cell.row, cell.col)] = cell.value
     
-    result_cells = []
-    
-    # For each cell in the input matrix B
+    # Interpret every non-empty cell for stakeholder clarity, concurrently
+    keys = []
+    calls = []
     for i in range(rows):
         for j in range(cols):
             term_b = b_cells.get((i, j), "")
-            
             if term_b:
-                # Interpret this cell for stakeholder clarity
-                interpret_result = cell_resolver.interpret_term(
-                    summed_text=term_b,
-                    station="objectives",
-                    row_label=f"row_{i}",
-                    col_label=f"col_{j}"
-                )
-                final_text = interpret_result.get("text", term_b)
-            else:
-                final_text = ""
+                keys.append((i, j))
+                calls.append((cell_resolver.interpret_term, {
+                    "summed_text": term_b,
+                    "station": "objectives",
+                    "row_label": f"row_{i}",
+                    "col_label": f"col_{j}"
+                }))
+    
+    final_texts = {}
+    for key, interpret_result in zip(keys, _run_cell_calls(calls)):
+        final_texts[key] = interpret_result.get("text", b_cells[key])
+    
+    result_cells = []
+    for i in range(rows):
+        for j in range(cols):
+            final_text = final_texts.get((i, j), "")
             
             # Create result cell
             cid = cell_id(f"{thread}:J:v1", i, j, final_text)
@@ -561,14 +616,12 @@ def _op_interpret_cell_by_cell(thread: str, B: Matrix, cell_resolver: _CellResol
             ))
     
     # Build result matrix
-    matrix_hash = content_hash(result_cells)
     J = Matrix(
         id=matrix_id(thread, "J", 1),
         name="J",
         station="objectives",
         shape=(rows, cols),
         cells=result_cells,
-        hash=matrix_hash,
         metadata={
             "timestamp": datetime.utcnow().isoformat(),
             "cell_operations": len(result_cells)
@@ -596,7 +649,7 @@ def op_elementwise(thread: str, J: Matrix, C: Matrix, resolver: Resolver) -> Tup
     
     # If using OpenAI resolver, switch to cell-by-cell approach
     if hasattr(resolver, 'client'):  # This is an OpenAI resolver
-        cell_resolver = CellResolver(model=getattr(resolver, 'model', 'gpt-4o'))
+        cell_resolver = CellResolver(model=getattr(resolver, 'model', 'gpt-4o'), cache=getattr(resolver, 'cache', None))
         return _op_elementwise_cell_by_cell(thread, J, C, cell_resolver)
     
     # Fallback to original approach for echo resolver
@@ -624,26 +677,31 @@ def _op_elementwise_cell_by_cell(thread: str, J: Matrix, C: Matrix, cell_resolve
     for cell in C.cells:
         c_cells[(cell.row, cell.col)] = cell.value
     
-    result_cells = []
-    
-    # For each cell position
+    # Element-wise semantic multiplication of each filled position, concurrently
+    keys = []
+    calls = []
     for i in range(rows):
         for j in range(cols):
             term_j = j_cells.get((i, j), "")
             term_c = c_cells.get((i, j), "")
-            
             if term_j and term_c:
-                # Element-wise semantic multiplication
-                mult_result = cell_resolver.multiply_terms(
-                    term_a=term_j,
-                    term_b=term_c,
-                    station="objectives",
-                    row_label=f"row_{i}",
-                    col_label=f"col_{j}"
-                )
-                final_text = mult_result.get("text", "")
-            else:
-                final_text = ""
+                keys.append((i, j))
+                calls.append((cell_resolver.multiply_terms, {
+                    "term_a": term_j,
+                    "term_b": term_c,
+                    "station": "objectives",
+                    "row_label": f"row_{i}",
+                    "col_label": f"col_{j}"
+                }))
+    
+    final_texts = {}
+    for key, mult_result in zip(keys, _run_cell_calls(calls)):
+        final_texts[key] = mult_result.get("text", "")
+    
+    result_cells = []
+    for i in range(rows):
+        for j in range(cols):
+            final_text = final_texts.get((i, j), "")
             
             # Create result cell
             cid = cell_id(f"{thread}:F:v1", i, j, final_text)
@@ -655,14 +713,12 @@ def _op_elementwise_cell_by_cell(thread: str, J: Matrix, C: Matrix, cell_resolve
             ))
     
     # Build result matrix
-    matrix_hash = content_hash(result_cells)
     F = Matrix(
         id=matrix_id(thread, "F", 1),
         name="F",
         station="objectives",
         shape=(rows, cols),
         cells=result_cells,
-        hash=matrix_hash,
         metadata={
             "timestamp": datetime.utcnow().isoformat(),
             "cell_operations": len(result_cells)
@@ -690,7 +746,7 @@ def op_add(thread: str, A: Matrix, F: Matrix, resolver: Resolver) -> Tuple[Matri
     
     # If using OpenAI resolver, switch to cell-by-cell approach
     if hasattr(resolver, 'client'):  # This is an OpenAI resolver
-        cell_resolver = CellResolver(model=getattr(resolver, 'model', 'gpt-4o'))
+        cell_resolver = CellResolver(model=getattr(resolver, 'model', 'gpt-4o'), cache=getattr(resolver, 'cache', None))
         return _op_add_cell_by_cell(thread, A, F, cell_resolver)
     
     # Fallback to original approach for echo resolver
@@ -718,9 +774,9 @@ def _op_add_cell_by_cell(thread: str, A: Matrix, F: Matrix, cell_resolver: _Cell
     for cell in F.cells:
         f_cells[(cell.row, cell.col)] = cell.value
     
-    result_cells = []
-    
-    # For each cell position
+    # Semantic addition at each filled position, concurrently
+    keys = []
+    calls = []
     for i in range(rows):
         for j in range(cols):
             term_a = a_cells.get((i, j), "")
@@ -730,16 +786,22 @@ def _op_add_cell_by_cell(thread: str, A: Matrix, F: Matrix, cell_resolver: _Cell
             terms_to_add = [term for term in [term_a, term_f] if term]
             
             if terms_to_add:
-                # Semantic addition
-                add_result = cell_resolver.add_terms(
-                    products=terms_to_add,
-                    station="objectives",
-                    row_label=f"row_{i}",
-                    col_label=f"col_{j}"
-                )
-                final_text = add_result.get("text", "")
-            else:
-                final_text = ""
+                keys.append((i, j))
+                calls.append((cell_resolver.add_terms, {
+                    "products": terms_to_add,
+                    "station": "objectives",
+                    "row_label": f"row_{i}",
+                    "col_label": f"col_{j}"
+                }))
+    
+    final_texts = {}
+    for key, add_result in zip(keys, _run_cell_calls(calls)):
+        final_texts[key] = add_result.get("text", "")
+    
+    result_cells = []
+    for i in range(rows):
+        for j in range(cols):
+            final_text = final_texts.get((i, j), "")
             
             # Create result cell
             cid = cell_id(f"{thread}:D:v1", i, j, final_text)
@@ -751,14 +813,12 @@ def _op_add_cell_by_cell(thread: str, A: Matrix, F: Matrix, cell_resolver: _Cell
             ))
     
     # Build result matrix
-    matrix_hash = content_hash(result_cells)
     D = Matrix(
         id=matrix_id(thread, "D", 1),
         name="D",
         station="objectives",
         shape=(rows, cols),
         cells=result_cells,
-        hash=matrix_hash,
         metadata={
             "timestamp": datetime.utcnow().isoformat(),
             "cell_operations": len(result_cells)
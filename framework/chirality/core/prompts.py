@@ -8,24 +8,24 @@ Each matrix cell is a coordinate (row_label × col_label) inside that landmark.
 Your job as the LLM: preserve and integrate meaning while mapping it faithfully into the valley's meta-ontology.
 """
 
-import re
-import unicodedata
-import json
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from ._text import normalize_and_escape
 
 def q(s: str) -> str:
     """Normalize unicode, collapse whitespace, and escape for prompt embedding."""
     if s is None:
         return ""
-    # Normalize unicode to NFKC (e.g., curly quotes → straight)
-    s = unicodedata.normalize("NFKC", str(s))
-    # Collapse internal whitespace while preserving single spaces
-    s = re.sub(r"\s+", " ", s).strip()
-    # Escape for embedding between quotes in our prompts
-    # Use json.dumps then strip outer quotes for robust escaping
-    return json.dumps(s, ensure_ascii=False)[1:-1]
+    # NFKC (e.g., curly quotes → straight), single-space whitespace, then the
+    # same escapes as JSON; canonical ASCII input is returned as-is
+    return normalize_and_escape(s)
+
+_DEFAULT_STATIONS = ("Problem Statement", "Requirements", "Objectives", "Solution Objectives")
+_DEFAULT_VALLEY_SUMMARY = f"Semantic Valley: {' → '.join(_DEFAULT_STATIONS)}"
 
 def _ensure_valley_summary(valley_summary: str) -> str:
-    return valley_summary.strip() or "Semantic Valley: Problem Statement → Requirements → Objectives → Solution Objectives"
+    return valley_summary.strip() or _DEFAULT_VALLEY_SUMMARY
 
 # Canonical system prompt — used for all semantic operations
 SYSTEM_PROMPT = """\
@@ -67,122 +67,143 @@ def generate_valley_summary(valley: dict | None, station: dict | None) -> str:
       station = { "index": int, "name": str }
     """
     if not valley or not isinstance(valley, dict):
-        return "Semantic Valley: Problem Statement → Requirements → Objectives → Solution Objectives"
+        return _DEFAULT_VALLEY_SUMMARY
     stations = valley.get("stations") or []
-    names = []
-    for i, s in enumerate(stations):
-        names.append(s.get("name", f"Station {i}"))
-    if not names:
-        names = ["Problem Statement", "Requirements", "Objectives", "Solution Objectives"]
+    names = tuple(s.get("name", f"Station {i}") for i, s in enumerate(stations))
     cur = (station or {}).get("index", None)
-    if isinstance(cur, int) and 0 <= cur < len(names):
-        names[cur] = f"[{names[cur]}]"
-    return f"Semantic Valley: {' → '.join(names)}"
+    # The summary depends only on the names and current index, which stay
+    # fixed for a whole matrix sweep
+    return _valley_summary(names, cur if isinstance(cur, int) else None)
 
-# === User-prompt templates ===
+@lru_cache(maxsize=256)
+def _valley_summary(names: Tuple[str, ...], cur: Optional[int]) -> str:
+    labels = list(names or _DEFAULT_STATIONS)
+    if cur is not None and 0 <= cur < len(labels):
+        labels[cur] = f"[{labels[cur]}]"
+    return f"Semantic Valley: {' → '.join(labels)}"
 
-def prompt_multiply(valley_summary, station, row_label, col_label, term_a, term_b):
-    valley_summary = _ensure_valley_summary(valley_summary)
-    return f"""\
-Role: expert in conceptual synthesis within station "{q(station)}" of the semantic valley.
+# === User-prompt templates ===
 
-Valley map:
-{valley_summary}
+class PromptBuilder:
+    """
+    Render user prompts for every cell of one matrix sweep.
 
-Position:
-- Row axis: "{q(row_label)}"
-- Column axis: "{q(col_label)}"
+    The role header and valley map are the same for all cells at a station, so
+    they are rendered once; row/column labels are escaped once per distinct label.
+    """
 
-Task (semantic multiplication, ×):
-Fuse these meanings at their intersection. Preserve both identities; remain within the station's scope.
-- "{q(term_a)}"
-- "{q(term_b)}"
+    def __init__(self, valley_summary: str, station: str = ""):
+        self.valley_summary = _ensure_valley_summary(valley_summary)
+        self.station = station
+        valley = f"Valley map:\n{self.valley_summary}\n\n"
+        station_q = q(station)
+        self._multiply_head = (
+            f'Role: expert in conceptual synthesis within station "{station_q}" of the semantic valley.\n\n' + valley
+        )
+        self._add_head = f'Role: expert integrator within station "{station_q}" of the semantic valley.\n\n' + valley
+        self._interpret_head = "Role: explanatory interpreter for stakeholders unfamiliar with the framework.\n\n" + valley
+        self._elementwise_head = (
+            'Role: expert in conceptual synthesis within station "Objectives" of the semantic valley.\n\n' + valley
+        )
+        self._add_d_head = 'Role: narrative synthesizer within station "Solution Objectives".\n\n' + valley
+        self._labels: dict = {}
+
+    def _label(self, label: str) -> str:
+        escaped = self._labels.get(label)
+        if escaped is None:
+            escaped = self._labels[label] = q(label)
+        return escaped
+
+    def _position(self, row_label: str, col_label: str, heading: str = "Position") -> str:
+        return (
+            f"{heading}:\n"
+            f'- Row axis: "{self._label(row_label)}"\n'
+            f'- Column axis: "{self._label(col_label)}"\n\n'
+        )
+
+    def multiply(self, row_label, col_label, term_a, term_b) -> str:
+        a = q(term_a)
+        b = q(term_b)
+        return (
+            self._multiply_head
+            + self._position(row_label, col_label)
+            + "Task (semantic multiplication, ×):\n"
+            "Fuse these meanings at their intersection. Preserve both identities; remain within the station's scope.\n"
+            f'- "{a}"\n'
+            f'- "{b}"\n\n'
+            'Output JSON ONLY (no extra text). "terms_used" must include EXACT normalized echoes of both inputs:\n'
+            f'{{"text": "", "terms_used": ["{a}","{b}"], "warnings": []}}\n'
+        )
+
+    def add(self, row_label, col_label, products: list[str]) -> str:
+        product_lines = "\n".join(f'- "{q(p)}"' for p in (products or []))
+        return (
+            self._add_head
+            + self._position(row_label, col_label)
+            + "Task (semantic addition, +):\n"
+            "Integrate the following product sentences into one coherent statement WITHOUT flattening distinctions:\n"
+            + (product_lines if product_lines else "- (no products provided)")
+            + "\n\n"
+            'Output JSON ONLY (no extra text). If products are empty, add "warnings": ["missing_input:products"]:\n'
+            '{"text": "", "terms_used": [], "warnings": []}\n'
+        )
+
+    def interpret(self, row_label, col_label, summed_text) -> str:
+        return (
+            self._interpret_head
+            + self._position(row_label, col_label)
+            + f'Input:\n"{q(summed_text)}"\n\n'
+            "Task (interpretation):\n"
+            "Re-express in clear language for stakeholders, preserving ontology and anchors.\n\n"
+            "Output JSON ONLY (no extra text):\n"
+            '{"text": "", "terms_used": [], "warnings": []}\n'
+        )
+
+    def elementwise_F(self, row_label, col_label, j_term, c_term) -> str:
+        j = q(j_term)
+        c = q(c_term)
+        return (
+            self._elementwise_head
+            + self._position(row_label, col_label, "Position (SAME coordinate across inputs)")
+            + "Task (element-wise multiplication for Objectives, ⊙):\n"
+            "Intersect the Objective frame and the Requirement for the SAME coordinate (i,j). Preserve both identities.\n"
+            f'- J(i,j): "{j}"\n'
+            f'- C(i,j): "{c}"\n\n'
+            'Output JSON ONLY (no extra text). "terms_used" must include EXACT normalized echoes of both inputs:\n'
+            f'{{"text": "", "terms_used": ["{j}","{c}"], "warnings": []}}\n'
+        )
+
+    def add_D(self, row_label, col_label, a_val, f_val) -> str:
+        a = q(a_val)
+        f = q(f_val)
+        composed = f"{a} applied to frame the problem; {f} to resolve the problem."
+        return (
+            self._add_d_head
+            + self._position(row_label, col_label)
+            + "Task (semantic addition, +):\n"
+            "Compose a single sentence in the pattern:\n"
+            f'"{composed}"\n\n'
+            'Output JSON ONLY (no extra text). "terms_used" must echo A and F exactly:\n'
+            f'{{"text": "{composed}", "terms_used": ["{a}","{f}"], "warnings": []}}\n'
+        )
+
+
+@lru_cache(maxsize=32)
+def _builder(valley_summary: str, station: str = "") -> PromptBuilder:
+    """Shared builder per valley map and station, so per-cell calls reuse its headers."""
+    return PromptBuilder(valley_summary, station)
 
-Output JSON ONLY (no extra text). "terms_used" must include EXACT normalized echoes of both inputs:
-{{"text": "", "terms_used": ["{q(term_a)}","{q(term_b)}"], "warnings": []}}
-"""
+def prompt_multiply(valley_summary, station, row_label, col_label, term_a, term_b):
+    return _builder(valley_summary, station).multiply(row_label, col_label, term_a, term_b)
 
 def prompt_add(valley_summary, station, row_label, col_label, products: list[str]):
-    valley_summary = _ensure_valley_summary(valley_summary)
-    product_lines = "\n".join(f'- "{q(p)}"' for p in (products or []))
-    return f"""\
-Role: expert integrator within station "{q(station)}" of the semantic valley.
-
-Valley map:
-{valley_summary}
-
-Position:
-- Row axis: "{q(row_label)}"
-- Column axis: "{q(col_label)}"
-
-Task (semantic addition, +):
-Integrate the following product sentences into one coherent statement WITHOUT flattening distinctions:
-{product_lines if product_lines else "- (no products provided)"}
-
-Output JSON ONLY (no extra text). If products are empty, add "warnings": ["missing_input:products"]:
-{{"text": "", "terms_used": [], "warnings": []}}
-"""
+    return _builder(valley_summary, station).add(row_label, col_label, products)
 
 def prompt_interpret(valley_summary, station, row_label, col_label, summed_text):
-    valley_summary = _ensure_valley_summary(valley_summary)
-    return f"""\
-Role: explanatory interpreter for stakeholders unfamiliar with the framework.
-
-Valley map:
-{valley_summary}
-
-Position:
-- Row axis: "{q(row_label)}"
-- Column axis: "{q(col_label)}"
-
-Input:
-"{q(summed_text)}"
-
-Task (interpretation):
-Re-express in clear language for stakeholders, preserving ontology and anchors.
-
-Output JSON ONLY (no extra text):
-{{"text": "", "terms_used": [], "warnings": []}}
-"""
+    return _builder(valley_summary, station).interpret(row_label, col_label, summed_text)
 
 def prompt_elementwise_F(valley_summary, row_label, col_label, j_term, c_term):
-    valley_summary = _ensure_valley_summary(valley_summary)
-    return f"""\
-Role: expert in conceptual synthesis within station "Objectives" of the semantic valley.
-
-Valley map:
-{valley_summary}
-
-Position (SAME coordinate across inputs):
-- Row axis: "{q(row_label)}"
-- Column axis: "{q(col_label)}"
-
-Task (element-wise multiplication for Objectives, ⊙):
-Intersect the Objective frame and the Requirement for the SAME coordinate (i,j). Preserve both identities.
-- J(i,j): "{q(j_term)}"
-- C(i,j): "{q(c_term)}"
-
-Output JSON ONLY (no extra text). "terms_used" must include EXACT normalized echoes of both inputs:
-{{"text": "", "terms_used": ["{q(j_term)}","{q(c_term)}"], "warnings": []}}
-"""
+    return _builder(valley_summary).elementwise_F(row_label, col_label, j_term, c_term)
 
 def prompt_add_D(valley_summary, row_label, col_label, a_val, f_val):
-    valley_summary = _ensure_valley_summary(valley_summary)
-    composed = f'{q(a_val)} applied to frame the problem; {q(f_val)} to resolve the problem.'
-    return f"""\
-Role: narrative synthesizer within station "Solution Objectives".
-
-Valley map:
-{valley_summary}
-
-Position:
-- Row axis: "{q(row_label)}"
-- Column axis: "{q(col_label)}"
-
-Task (semantic addition, +):
-Compose a single sentence in the pattern:
-"{q(a_val)} applied to frame the problem; {q(f_val)} to resolve the problem."
-
-Output JSON ONLY (no extra text). "terms_used" must echo A and F exactly:
-{{"text": "{composed}", "terms_used": ["{q(a_val)}","{q(f_val)}"], "warnings": []}}
-"""
\ No newline at end of file
+    return _builder(valley_summary).add_D(row_label, col_label, a_val, f_val)
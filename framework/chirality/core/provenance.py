@@ -6,10 +6,86 @@ Maintains audit trail and lineage for all semantic transformations.
 
 import hashlib
 import json
-import unicodedata
-import re
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import time
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+
+from ._text import normalize_text as _normalize
+
+
+def _dumps_canonical(obj: Any) -> bytes:
+    """
+    Serialize to key-sorted JSON bytes for hashing.
+    
+    Keeps json.dumps' default separators and ASCII escaping: persisted
+    matrix hashes and operation IDs were computed from exactly these bytes.
+    Always the stdlib encoder, since faster backends format some floats
+    (1e16, 1e-7) and NaN differently.
+    """
+    return json.dumps(obj, sort_keys=True).encode("utf-8")
+
+
+# hashlib's constructors are backed by OpenSSL, which uses the CPU's SHA
+# extensions (SHA-NI / ARMv8 SHA2) where available. Bind once to skip the
+# module attribute lookup in hot loops.
+_sha256 = hashlib.sha256
+
+
+def _record_hash(record: Dict[str, Any]) -> str:
+    """
+    Short integrity hash over a provenance record, ignoring its "hash" key.
+    
+    Records are small dicts of strings and string lists, so fields are fed to
+    the hash directly rather than through canonical JSON; only other values
+    are serialized. Every key, value and list element is length-prefixed, so
+    no choice of field contents can make two different records encode alike.
+    """
+    h = _sha256()
+    update = h.update
+    for key in sorted(record):
+        if key == "hash":
+            continue
+        value = record[key]
+        data = key.encode("utf-8")
+        update(b"%d:" % len(data))
+        update(data)
+        if type(value) is str:
+            data = value.encode("utf-8")
+            update(b"s%d:" % len(data))
+            update(data)
+        elif type(value) is list and all(type(v) is str for v in value):
+            update(b"l%d:" % len(value))
+            for item in value:
+                data = item.encode("utf-8")
+                update(b"%d:" % len(data))
+                update(data)
+        else:
+            data = _dumps_canonical(value)
+            update(b"j%d:" % len(data))
+            update(data)
+    return h.hexdigest()[:16]
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recent call; replaced as a
+# whole tuple so concurrent readers never see a mismatched pair
+_iso_second = (-1, "")
+
+
+def _now_iso() -> str:
+    """
+    Current UTC time in the format of datetime.utcnow().isoformat().
+    
+    Formats from time.time_ns() and reuses the date/time prefix within a second.
+    """
+    global _iso_second
+    sec, usec = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_sec, prefix = _iso_second
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _iso_second = (sec, prefix)
+    return f"{prefix}.{usec:06d}" if usec else prefix
 
 
 def canonical_value(value: Any) -> str:
@@ -32,13 +108,13 @@ def canonical_value(value: Any) -> str:
         return str(value)
 
 
-def _normalize(s: str) -> str:
-    """Normalize string for consistent hashing (from semmul_cf14.py)."""
-    if s is None:
-        return ""
-    s = unicodedata.normalize("NFKC", str(s))
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+@lru_cache(maxsize=32)
+def _system_hash_state(system: str):
+    """SHA256 state primed with a canonicalized system prompt; copy before use."""
+    h = _sha256()
+    h.update(canonical_value(system).encode("utf-8"))
+    h.update(b"\n\n")
+    return h
 
 
 def prompt_hash(system: str, user: str, context: Dict[str, Any]) -> str:
@@ -53,12 +129,11 @@ def prompt_hash(system: str, user: str, context: Dict[str, Any]) -> str:
     Returns:
         SHA256 hash
     """
-    h = hashlib.sha256()
-    h.update(canonical_value(system).encode("utf-8"))
-    h.update(b"\n\n")
+    # System prompts are a handful of large constants; reuse their hash state
+    h = _system_hash_state(system).copy()
     h.update(canonical_value(user).encode("utf-8"))
     h.update(b"\n\n")
-    h.update(json.dumps(context, sort_keys=True).encode("utf-8"))
+    h.update(_dumps_canonical(context))
     return h.hexdigest()
 
 
@@ -75,11 +150,11 @@ def content_hash(data: Any) -> str:
     if isinstance(data, list):
         # For cells list, sort by position for determinism
         sorted_data = sorted(data, key=lambda x: (getattr(x, 'row', 0), getattr(x, 'col', 0)))
-        content = json.dumps([canonical_value(getattr(x, 'value', getattr(x, 'content', {}).get('text', str(x)))) for x in sorted_data], sort_keys=True)
+        content = _dumps_canonical([canonical_value(getattr(x, 'value', getattr(x, 'content', {}).get('text', str(x)))) for x in sorted_data])
     else:
-        content = canonical_value(data)
+        content = canonical_value(data).encode("utf-8")
     
-    return hashlib.sha256(content.encode()).hexdigest()[:16]
+    return _sha256(content).hexdigest()[:16]
 
 
 class ProvenanceTracker:
@@ -87,8 +162,63 @@ class ProvenanceTracker:
     
     def __init__(self):
         """Initialize provenance tracker."""
-        self.operations = []
-        self.lineage = {}
+        # Columnar storage: one list per field, indexed by operation number.
+        # Per-operation dicts are only built at the boundary (operations,
+        # lineage, export_provenance).
+        self._op_ids: List[str] = []
+        self._op_types: List[str] = []
+        self._op_timestamps: List[str] = []
+        self._op_metadata: List[Dict[str, Any]] = []
+        # CSR layout: operation i's inputs are _inputs[_input_offsets[i]:_input_offsets[i + 1]]
+        self._inputs: List[str] = []
+        self._input_offsets: List[int] = [0]
+        self._outputs: List[str] = []
+        self._output_offsets: List[int] = [0]
+        # Output ID -> index of the operation that produced it
+        self._producers: Dict[str, int] = {}
+    
+    @property
+    def operations(self) -> Tuple[Dict[str, Any], ...]:
+        """
+        Tracked operations as records, in tracking order.
+        
+        A read-only snapshot; record operations with track_operation.
+        """
+        return tuple(self._operation(idx) for idx in range(len(self._op_ids)))
+    
+    @property
+    def lineage(self) -> Mapping[str, Dict[str, Any]]:
+        """
+        Lineage record for every tracked output ID.
+        
+        A read-only snapshot; lineage is updated by track_operation.
+        """
+        return MappingProxyType(
+            {output_id: self._lineage_entry(idx) for output_id, idx in self._producers.items()}
+        )
+    
+    def _op_inputs(self, idx: int) -> List[str]:
+        return self._inputs[self._input_offsets[idx]:self._input_offsets[idx + 1]]
+    
+    def _op_outputs(self, idx: int) -> List[str]:
+        return self._outputs[self._output_offsets[idx]:self._output_offsets[idx + 1]]
+    
+    def _operation(self, idx: int) -> Dict[str, Any]:
+        return {
+            "id": self._op_ids[idx],
+            "type": self._op_types[idx],
+            "inputs": self._op_inputs(idx),
+            "outputs": self._op_outputs(idx),
+            "timestamp": self._op_timestamps[idx],
+            "metadata": self._op_metadata[idx]
+        }
+    
+    def _lineage_entry(self, idx: int) -> Dict[str, Any]:
+        return {
+            "operation": self._op_ids[idx],
+            "sources": self._op_inputs(idx),
+            "timestamp": self._op_timestamps[idx]
+        }
     
     def track_operation(self,
                        operation_type: str,
@@ -107,26 +237,51 @@ class ProvenanceTracker:
         Returns:
             Operation ID
         """
-        operation = {
-            "id": self._generate_operation_id(operation_type, inputs),
-            "type": operation_type,
-            "inputs": inputs,
-            "outputs": outputs,
-            "timestamp": datetime.utcnow().isoformat(),
-            "metadata": metadata or {}
-        }
+        # One timestamp per operation, shared by its ID, record and lineage
+        return self._append(operation_type, inputs, outputs, metadata, _now_iso())
+    
+    def track_bulk(self, operations: List[Dict[str, Any]]) -> List[str]:
+        """
+        Track several operations at once under a single timestamp.
         
-        self.operations.append(operation)
+        Args:
+            operations: Dicts with track_operation's arguments as keys
+                (operation_type, inputs, outputs, optional metadata)
+        
+        Returns:
+            Operation IDs, in input order
+        """
+        timestamp = _now_iso()
+        return [
+            self._append(op["operation_type"], op["inputs"], op["outputs"],
+                         op.get("metadata"), timestamp)
+            for op in operations
+        ]
+    
+    def _append(self,
+                operation_type: str,
+                inputs: List[str],
+                outputs: List[str],
+                metadata: Optional[Dict[str, Any]],
+                timestamp: str) -> str:
+        """Append one operation to the columns and update lineage."""
+        op_id = self._generate_operation_id(operation_type, inputs, timestamp)
+        idx = len(self._op_ids)
+        
+        self._op_ids.append(op_id)
+        self._op_types.append(operation_type)
+        self._op_timestamps.append(timestamp)
+        self._op_metadata.append(metadata or {})
+        self._inputs.extend(inputs)
+        self._input_offsets.append(len(self._inputs))
+        self._outputs.extend(outputs)
+        self._output_offsets.append(len(self._outputs))
         
         # Update lineage
         for output_id in outputs:
-            self.lineage[output_id] = {
-                "operation": operation["id"],
-                "sources": inputs,
-                "timestamp": operation["timestamp"]
-            }
+            self._producers[output_id] = idx
         
-        return operation["id"]
+        return op_id
     
     def get_lineage(self, entity_id: str, depth: int = 1) -> Dict[str, Any]:
         """
@@ -139,10 +294,11 @@ class ProvenanceTracker:
         Returns:
             Lineage tree
         """
-        if entity_id not in self.lineage:
+        idx = self._producers.get(entity_id)
+        if idx is None:
             return {"id": entity_id, "lineage": None}
         
-        lineage = self.lineage[entity_id].copy()
+        lineage = self._lineage_entry(idx)
         
         if depth > 1 and lineage.get("sources"):
             lineage["sources"] = [
@@ -165,13 +321,22 @@ class ProvenanceTracker:
         Returns:
             SHA256 hash
         """
-        sorted_data = json.dumps(data, sort_keys=True)
-        return hashlib.sha256(sorted_data.encode()).hexdigest()
+        return _sha256(_dumps_canonical(data)).hexdigest()
     
-    def _generate_operation_id(self, operation_type: str, inputs: List[str]) -> str:
+    def _generate_operation_id(self,
+                               operation_type: str,
+                               inputs: List[str],
+                               timestamp: Optional[str] = None) -> str:
         """Generate deterministic operation ID."""
-        content = f"{operation_type}:{':'.join(sorted(inputs))}:{datetime.utcnow().isoformat()}"
-        return f"op_{hashlib.sha256(content.encode()).hexdigest()[:12]}"
+        if timestamp is None:
+            timestamp = _now_iso()
+        # Feed the parts straight into the hash rather than formatting one string
+        h = _sha256(operation_type.encode())
+        h.update(b":")
+        h.update(":".join(sorted(inputs)).encode())
+        h.update(b":")
+        h.update(timestamp.encode())
+        return f"op_{h.hexdigest()[:12]}"
     
     def export_provenance(self) -> Dict[str, Any]:
         """
@@ -181,15 +346,16 @@ class ProvenanceTracker:
             Complete provenance data
         """
         return {
-            "operations": self.operations,
-            "lineage": self.lineage,
-            "exported_at": datetime.utcnow().isoformat()
+            "operations": list(self.operations),
+            "lineage": dict(self.lineage),
+            "exported_at": _now_iso()
         }
 
 
 def create_cell_provenance(operation: str,
                           sources: List[str],
-                          metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                          metadata: Optional[Dict[str, Any]] = None,
+                          timestamp: Optional[str] = None) -> Dict[str, Any]:
     """
     Create provenance record for a cell.
     
@@ -197,6 +363,8 @@ def create_cell_provenance(operation: str,
         operation: Operation that created the cell
         sources: Source IDs
         metadata: Additional metadata
+        timestamp: ISO timestamp to record (default: now); pass one value to
+            stamp every cell of a matrix alike
     
     Returns:
         Provenance dictionary
@@ -204,16 +372,14 @@ def create_cell_provenance(operation: str,
     provenance = {
         "operation": operation,
         "sources": sources,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _now_iso() if timestamp is None else timestamp
     }
     
     if metadata:
         provenance["metadata"] = metadata
     
     # Generate hash for integrity
-    provenance["hash"] = hashlib.sha256(
-        json.dumps(provenance, sort_keys=True).encode()
-    ).hexdigest()[:16]
+    provenance["hash"] = _record_hash(provenance)
     
     return provenance
 
@@ -231,17 +397,7 @@ def verify_provenance_integrity(provenance: Dict[str, Any]) -> bool:
     if "hash" not in provenance:
         return False
     
-    stored_hash = provenance["hash"]
-    
-    # Recalculate hash
-    prov_copy = provenance.copy()
-    del prov_copy["hash"]
-    
-    calculated_hash = hashlib.sha256(
-        json.dumps(prov_copy, sort_keys=True).encode()
-    ).hexdigest()[:16]
-    
-    return stored_hash == calculated_hash
+    return provenance["hash"] == _record_hash(provenance)
 
 
 def merge_provenance(prov1: Dict[str, Any], prov2: Dict[str, Any]) -> Dict[str, Any]:
@@ -255,14 +411,16 @@ def merge_provenance(prov1: Dict[str, Any], prov2: Dict[str, Any]) -> Dict[str,
     Returns:
         Merged provenance
     """
-    merged_sources = list(set(
-        prov1.get("sources", []) + prov2.get("sources", [])
-    ))
+    # Ordered union: set() ordering varies between processes, which made the
+    # merged record (and its hash) non-reproducible
+    merged_sources = list(dict.fromkeys(chain(
+        prov1.get("sources", ()), prov2.get("sources", ())
+    )))
     
     merged = {
         "operation": "merge",
         "sources": merged_sources,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _now_iso(),
         "parent_operations": [
             prov1.get("operation"),
             prov2.get("operation")
@@ -280,8 +438,6 @@ def merge_provenance(prov1: Dict[str, Any], prov2: Dict[str, Any]) -> Dict[str,
         merged["metadata"] = metadata
     
     # Generate new hash
-    merged["hash"] = hashlib.sha256(
-        json.dumps(merged, sort_keys=True).encode()
-    ).hexdigest()[:16]
+    merged["hash"] = _record_hash(merged)
     
     return merged
\ No newline at end of file
@@ -4,11 +4,56 @@ Serialization utilities for CF14 structures.
 Handles JSON I/O for matrices, cells, and operations.
 """
 
+import io
 import json
-from typing import Dict, Any, List, Optional, Union
+import math
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, TextIO, Tuple, Union
 from pathlib import Path
 
-from .types import Cell, Matrix, MatrixType, Modality
+from .types import Cell, Matrix, MatrixType, Modality, _MODALITY_BY_VALUE
+from ._text import normalize_text as _normalize_text
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # Optional speedup; falls back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # Optional binary archive format
+    msgpack = None
+
+# Version tag for the binary matrix archive layout
+_BINARY_FORMAT = 1
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Whether any float nested in obj is NaN or infinite."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def _matrix_json_bytes(matrix: Matrix, indent: Optional[int] = 2) -> bytes:
+    """Encode a matrix as UTF-8 JSON bytes, via orjson when available."""
+    data = matrix.to_dict()
+    # orjson only supports compact or 2-space output, and writes NaN and
+    # Infinity as null where json keeps them
+    if orjson is not None and indent in (None, 2) and not _has_non_finite(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass  # Data orjson rejects (e.g. non-str keys); let json handle it
+    # Compact output uses orjson's separators so bytes match either way
+    separators = (",", ":") if indent is None else None
+    return json.dumps(data, indent=indent, separators=separators, ensure_ascii=False).encode("utf-8")
 
 
 def matrix_to_json(matrix: Matrix, indent: Optional[int] = 2) -> str:
@@ -22,20 +67,27 @@ def matrix_to_json(matrix: Matrix, indent: Optional[int] = 2) -> str:
     Returns:
         JSON string
     """
-    return json.dumps(matrix.to_dict(), indent=indent, ensure_ascii=False)
+    return _matrix_json_bytes(matrix, indent).decode("utf-8")
 
 
-def matrix_from_json(json_str: str) -> Matrix:
+def matrix_from_json(json_str: Union[str, bytes]) -> Matrix:
     """
     Deserialize matrix from JSON string.
     
     Args:
-        json_str: JSON string
+        json_str: JSON string (or UTF-8 bytes)
     
     Returns:
         Matrix instance
     """
-    data = json.loads(json_str)
+    if orjson is None:
+        data = json.loads(json_str)
+    else:
+        try:
+            data = orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which json writes and reads
+            data = json.loads(json_str)
     return Matrix.from_dict(data)
 
 
@@ -50,8 +102,9 @@ def save_matrix(matrix: Matrix, filepath: Union[str, Path]) -> None:
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(matrix_to_json(matrix))
+    # Bytes straight to disk; no str round-trip or text-mode encoding
+    with open(filepath, "wb") as f:
+        f.write(_matrix_json_bytes(matrix))
 
 
 def load_matrix(filepath: Union[str, Path]) -> Matrix:
@@ -66,10 +119,111 @@ def load_matrix(filepath: Union[str, Path]) -> Matrix:
     """
     filepath = Path(filepath)
     
-    with open(filepath, "r", encoding="utf-8") as f:
+    with open(filepath, "rb") as f:
         return matrix_from_json(f.read())
 
 
+def _pack_positions(values: List[int]) -> Tuple[str, bytes]:
+    """Pack row/col indices as little-endian uint16 (uint32 if any exceed it)."""
+    typecode = "H" if not values or max(values) <= 0xFFFF else "I"
+    packed = array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return typecode, packed.tobytes()
+
+
+def _unpack_positions(typecode: str, data: bytes) -> array:
+    positions = array(typecode)
+    positions.frombytes(data)
+    if sys.byteorder == "big":
+        positions.byteswap()
+    return positions
+
+
+def save_matrix_binary(matrix: Matrix, filepath: Union[str, Path]) -> None:
+    """
+    Save matrix to a msgpack archive.
+    
+    Cells are stored column-wise: packed row/col index arrays plus flat lists
+    of ids, texts, modalities and provenance, behind a small header.
+    
+    Args:
+        matrix: Matrix to save
+        filepath: Output file path
+    """
+    if msgpack is None:
+        raise ImportError("msgpack package required. Install with: pip install msgpack")
+    
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    
+    cells = matrix.cells
+    row_code, rows = _pack_positions([c.row for c in cells])
+    col_code, cols = _pack_positions([c.col for c in cells])
+    archive = {
+        "format": _BINARY_FORMAT,
+        "hdr": {
+            "id": matrix.id,
+            "name": matrix.name,
+            "station": matrix.station,
+            "shape": list(matrix.shape),
+            "hash": matrix.hash,
+            "metadata": matrix.metadata,
+        },
+        "row_type": row_code,
+        "rows": rows,
+        "col_type": col_code,
+        "cols": cols,
+        "ids": [c.id for c in cells],
+        "texts": [c.value for c in cells],
+        "modalities": [c.modality.value for c in cells],
+        "provenance": [c.provenance for c in cells],
+    }
+    
+    with open(filepath, "wb") as f:
+        msgpack.pack(archive, f, use_bin_type=True)
+
+
+def load_matrix_binary(filepath: Union[str, Path]) -> Matrix:
+    """
+    Load matrix from a msgpack archive written by save_matrix_binary.
+    
+    Args:
+        filepath: Input file path
+    
+    Returns:
+        Matrix instance
+    """
+    if msgpack is None:
+        raise ImportError("msgpack package required. Install with: pip install msgpack")
+    
+    with open(filepath, "rb") as f:
+        archive = msgpack.unpack(f, raw=False)
+    
+    if archive.get("format") != _BINARY_FORMAT:
+        raise ValueError(f"Unsupported matrix archive format: {archive.get('format')}")
+    
+    hdr = archive["hdr"]
+    rows = _unpack_positions(archive["row_type"], archive["rows"])
+    cols = _unpack_positions(archive["col_type"], archive["cols"])
+    unknown = Modality.UNKNOWN
+    cells = [
+        Cell(cid, r, c, text, _MODALITY_BY_VALUE.get(modality, unknown), prov)
+        for cid, r, c, text, modality, prov in zip(
+            archive["ids"], rows, cols, archive["texts"], archive["modalities"], archive["provenance"]
+        )
+    ]
+    return Matrix(
+        id=hdr["id"],
+        name=hdr["name"],
+        station=hdr["station"],
+        shape=tuple(hdr["shape"]),
+        cells=cells,
+        hash=hdr.get("hash"),
+        metadata=hdr.get("metadata") or {},
+    )
+
+
 def cells_to_table(cells: List[Cell], max_rows: Optional[int] = None, max_cols: Optional[int] = None) -> List[List[str]]:
     """
     Convert cells to 2D table for display.
@@ -85,78 +239,112 @@ def cells_to_table(cells: List[Cell], max_rows: Optional[int] = None, max_cols:
     if not cells:
         return []
     
-    # Find dimensions
-    max_r = max(c.row for c in cells) + 1
-    max_c = max(c.col for c in cells) + 1
-    
+    # Single scan over the cells: track extents and collect positions/texts
+    rows: List[int] = []
+    cols: List[int] = []
+    texts: List[str] = []
+    add_row, add_col, add_text = rows.append, cols.append, texts.append
+    top_r = top_c = -1
+    for cell in cells:
+        r = cell.row
+        c = cell.col
+        if r > top_r:
+            top_r = r
+        if c > top_c:
+            top_c = c
+        add_row(r)
+        add_col(c)
+        add_text(cell.value)
+    
+    max_r = top_r + 1
+    max_c = top_c + 1
     if max_rows:
         max_r = min(max_r, max_rows)
     if max_cols:
         max_c = min(max_c, max_cols)
     
-    # Create table
-    table = [["" for _ in range(max_c)] for _ in range(max_r)]
+    # Create table (row-list replication avoids a per-slot comprehension)
+    table = [[""] * max_c for _ in range(max_r)]
     
-    for cell in cells:
-        if cell.row < max_r and cell.col < max_c:
-            text = cell.content.get("text", "")
+    for r, c, text in zip(rows, cols, texts):
+        if r < max_r and c < max_c:
             # Truncate long text
             if len(text) > 50:
                 text = text[:47] + "..."
-            table[cell.row][cell.col] = text
+            table[r][c] = text
     
     return table
 
 
-def format_matrix_summary(matrix: Matrix) -> str:
+def format_matrix_summary(matrix: Matrix, out: Optional[TextIO] = None) -> Optional[str]:
     """
     Format matrix summary for display.
     
     Args:
         matrix: Matrix to summarize
+        out: Stream to write the summary to instead of returning it
     
     Returns:
-        Formatted summary string
+        Formatted summary string, or None when written to ``out``
     """
-    lines = [
-        f"Matrix {matrix.type.value} ({matrix.id})",
-        f"Dimensions: {matrix.dimensions[0]}×{matrix.dimensions[1]}",
-        f"Cells: {len(matrix.cells)}"
-    ]
+    if out is None:
+        buf = io.StringIO()
+        format_matrix_summary(matrix, buf)
+        return buf.getvalue()
+    write = out.write
+    
+    write(f"Matrix {matrix.type.value} ({matrix.id})\n"
+          f"Dimensions: {matrix.dimensions[0]}×{matrix.dimensions[1]}\n"
+          f"Cells: {len(matrix.cells)}")
     
     if matrix.metadata:
-        lines.append(f"Metadata: {list(matrix.metadata.keys())}")
+        write(f"\nMetadata: {list(matrix.metadata.keys())}")
     
     # Sample cells
     if matrix.cells:
-        lines.append("\nSample cells:")
+        write("\n\nSample cells:")
         table = cells_to_table(matrix.cells[:9], max_rows=3, max_cols=3)
         for row in table:
-            lines.append("  " + " | ".join(f"{c[:20]:20}" for c in row))
+            write("\n  " + " | ".join(f"{c[:20]:20}" for c in row))
     
-    return "\n".join(lines)
+    return None
 
 
-def export_pipeline_results(results: Dict[str, Matrix], output_dir: Union[str, Path]) -> Dict[str, str]:
+def export_pipeline_results(results: Dict[str, Matrix], output_dir: Union[str, Path],
+                            binary: bool = False) -> Dict[str, str]:
     """
     Export pipeline results to directory.
     
     Args:
         results: Dictionary of matrices
         output_dir: Output directory
+        binary: Also write a msgpack archive per matrix (requires msgpack)
     
     Returns:
-        Dictionary of output file paths
+        Dictionary of output file paths (archives under "<name>_msgpack")
     """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
     paths = {}
+    writes = []
     
     for name, matrix in results.items():
         filepath = output_dir / f"matrix_{name}.json"
-        save_matrix(matrix, filepath)
+        writes.append((save_matrix, matrix, filepath))
         paths[name] = str(filepath)
+        if binary:
+            archive_path = output_dir / f"matrix_{name}.msgpack"
+            writes.append((save_matrix_binary, matrix, archive_path))
+            paths[f"{name}_msgpack"] = str(archive_path)
+    
+    # Files are independent, so write them concurrently; result() re-raises
+    # the first failure
+    if writes:
+        with ThreadPoolExecutor(max_workers=min(8, len(writes))) as pool:
+            futures = [pool.submit(save, matrix, path) for save, matrix, path in writes]
+            for future in futures:
+                future.result()
     
     # Write summary
     summary_path = output_dir / "summary.txt"
@@ -167,7 +355,7 @@ def export_pipeline_results(results: Dict[str, Matrix], output_dir: Union[str, P
         for name, matrix in results.items():
             f.write(f"\n{name}:\n")
             f.write("-" * 20 + "\n")
-            f.write(format_matrix_summary(matrix))
+            format_matrix_summary(matrix, out=f)
             f.write("\n\n")
     
     paths["summary"] = str(summary_path)
@@ -185,19 +373,10 @@ def normalize_text(text: str) -> str:
     Returns:
         Normalized text
     """
-    import unicodedata
-    import re
-    
     if not text:
         return ""
     
-    # Normalize unicode
-    text = unicodedata.normalize("NFKC", str(text))
-    
-    # Collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
-    
-    return text
+    return _normalize_text(text)
 
 
 def create_empty_matrix(matrix_type: MatrixType, dimensions: tuple[int, int], thread_id: str = "default") -> Matrix:
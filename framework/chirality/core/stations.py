@@ -6,14 +6,14 @@ S2: Requirements analysis (C = A × B)
 S3: Objective synthesis (J, F, D outputs)
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
-from datetime import datetime
 
-from .types import Matrix, MatrixType, Cell, Station, StationType
+from .types import Matrix, Cell, Station, StationType
 from .ids import generate_matrix_id, generate_cell_id
 from .ops import Resolver, EchoResolver, op_multiply, op_interpret, op_elementwise, op_add
 from .validate import validate_matrix, validate_matrix_dimensions
-from .provenance import create_cell_provenance, ProvenanceTracker
+from .provenance import create_cell_provenance, ProvenanceTracker, _now_iso
 
 
 class StationRunner:
@@ -81,11 +81,11 @@ class S1Runner(StationRunner):
         matrix_b = inputs["B"]
         
         # Validate matrices
-        errors_a = validate_matrix(matrix_a)
+        errors_a = validate_matrix(matrix_a, fast=True)
         if errors_a:
             raise ValueError(f"Matrix A validation failed: {errors_a}")
         
-        errors_b = validate_matrix(matrix_b)
+        errors_b = validate_matrix(matrix_b, fast=True)
         if errors_b:
             raise ValueError(f"Matrix B validation failed: {errors_b}")
         
@@ -103,7 +103,7 @@ class S1Runner(StationRunner):
             "s1_load",
             [],
             [matrix_a.id, matrix_b.id],
-            {"station": "S1", "timestamp": datetime.utcnow().isoformat()}
+            {"station": "S1", "timestamp": _now_iso()}
         )
         
         return {"A": matrix_a, "B": matrix_b}
@@ -253,58 +253,45 @@ class S3Runner(StationRunner):
     
     def _generate_function_matrix(self, matrix_c: Matrix, thread_id: str, context: Dict[str, Any]) -> Matrix:
         """Generate function matrix from C."""
-        matrix_id = generate_matrix_id("F", thread_id, 0)
-        cells = []
-        
         # For F, we extract functional aspects (simplified for now)
-        for c_cell in matrix_c.cells:
-            cell_content = {
-                "text": f"Function: {c_cell.content.get('text', '')[:50]}",
-                "type": "function",
-                "provenance": create_cell_provenance("extract_function", [c_cell.id])
-            }
-            
-            cell_id = generate_cell_id(matrix_id, c_cell.row, c_cell.col, cell_content)
-            cells.append(Cell(
-                id=cell_id,
-                row=c_cell.row,
-                col=c_cell.col,
-                content=cell_content
-            ))
-        
-        return Matrix(
-            id=matrix_id,
-            type=MatrixType.F,
-            cells=cells,
-            dimensions=matrix_c.dimensions,
-            metadata={"source": matrix_c.id, "operation": "extract_function"}
-        )
+        return _derive_matrix(matrix_c, "F", thread_id, "Function: ", "extract_function")
     
     def _generate_domain_matrix(self, matrix_c: Matrix, thread_id: str, context: Dict[str, Any]) -> Matrix:
         """Generate domain matrix from C."""
-        matrix_id = generate_matrix_id("D", thread_id, 0)
-        cells = []
-        
         # For D, we map to domain concepts (simplified for now)
-        for c_cell in matrix_c.cells:
-            cell_content = {
-                "text": f"Domain: {c_cell.content.get('text', '')[:50]}",
-                "type": "domain",
-                "provenance": create_cell_provenance("map_domain", [c_cell.id])
-            }
-            
-            cell_id = generate_cell_id(matrix_id, c_cell.row, c_cell.col, cell_content)
-            cells.append(Cell(
-                id=cell_id,
-                row=c_cell.row,
-                col=c_cell.col,
-                content=cell_content
-            ))
-        
-        return Matrix(
-            id=matrix_id,
-            type=MatrixType.D,
-            cells=cells,
-            dimensions=matrix_c.dimensions,
-            metadata={"source": matrix_c.id, "operation": "map_domain"}
-        )
\ No newline at end of file
+        return _derive_matrix(matrix_c, "D", thread_id, "Domain: ", "map_domain")
+
+
+@lru_cache(maxsize=100_000)
+def _cell_id(matrix_id: str, row: int, col: int, text: str) -> str:
+    """Memoized generate_cell_id for text-only content; bounded so long runs don't grow without limit."""
+    return generate_cell_id(matrix_id, row, col, {"text": text})
+
+
+def _derive_matrix(matrix_c: Matrix, name: str, thread_id: str, label: str, operation: str) -> Matrix:
+    """
+    Build a matrix whose cells are labelled excerpts of C's cells.
+    
+    All cells share one provenance timestamp, taken once per matrix.
+    """
+    matrix_id = generate_matrix_id(name, thread_id, 0)
+    timestamp = _now_iso()
+    cells = []
+    for c in matrix_c.cells:
+        text = label + c.value[:50]
+        cells.append(Cell(
+            id=_cell_id(matrix_id, c.row, c.col, text),
+            row=c.row,
+            col=c.col,
+            value=text,
+            provenance=create_cell_provenance(operation, [c.id], timestamp=timestamp)
+        ))
+    
+    return Matrix(
+        id=matrix_id,
+        name=name,
+        station="objectives",
+        shape=matrix_c.shape,
+        cells=cells,
+        metadata={"source": matrix_c.id, "operation": operation}
+    )
@@ -4,11 +4,14 @@ Core types for Chirality Framework CF14 protocol.
 Defines the fundamental data structures: Cell, Matrix, Tensor, Station, Operation.
 """
 
+import sys
 from typing import Any, Dict, List, Optional, Literal
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from .provenance import content_hash
+
 
 class Modality(str, Enum):
     """CF14 modalities for semantic content."""
@@ -21,6 +24,10 @@ class Modality(str, Enum):
     UNKNOWN = "unknown"
 
 
+# Plain dict lookup is much cheaper than Modality(...) in bulk deserialization
+_MODALITY_BY_VALUE: Dict[str, Modality] = {m.value: m for m in Modality}
+
+
 class MatrixType(str, Enum):
     """Matrix types in CF14 protocol."""
     A = "A"  # Axioms
@@ -31,6 +38,14 @@ class MatrixType(str, Enum):
     J = "J"  # Judgment
 
 
+_MATRIX_TYPE_BY_VALUE: Dict[str, MatrixType] = {t.value: t for t in MatrixType}
+
+
+def _intern(value: Any) -> Any:
+    """Intern plain str values; str-Enum members and other types pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class StationType(str, Enum):
     """Station types for processing stages."""
     S1 = "S1"  # Problem formulation
@@ -63,18 +78,24 @@ class Cell:
         """Legacy property for compatibility."""
         return {"text": self.value}
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert cell to dictionary for serialization."""
-        return {
+    def to_dict(self, include_legacy: bool = True) -> Dict[str, Any]:
+        """
+        Convert cell to dictionary for serialization.
+        
+        Args:
+            include_legacy: Also emit the legacy ``content`` key
+        """
+        data = {
             "id": self.id,
             "row": self.row,
             "col": self.col,
             "value": self.value,
             "modality": self.modality.value,
             "provenance": self.provenance,
-            # Legacy compatibility
-            "content": {"text": self.value}
         }
+        if include_legacy:
+            data["content"] = {"text": self.value}
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Cell":
@@ -91,16 +112,52 @@ class Cell:
         else:
             value = ""
         
+        # "provenance": null reads as no provenance, as in _from_canonical
+        provenance = data.get("provenance")
         return cls(
             id=data["id"],
             row=data["row"],
             col=data["col"],
             value=value,
-            modality=Modality(data.get("modality", "unknown")),
-            provenance=data.get("provenance", {})
+            modality=_MODALITY_BY_VALUE.get(data.get("modality", "unknown"), Modality.UNKNOWN),
+            provenance={} if provenance is None else provenance
+        )
+    
+    @classmethod
+    def _from_canonical(cls, data: Dict[str, Any]) -> "Cell":
+        """Create cell from a dictionary known to carry the canonical "value" key."""
+        provenance = data.get("provenance")
+        return cls(
+            data["id"],
+            data["row"],
+            data["col"],
+            data["value"],
+            _MODALITY_BY_VALUE.get(data.get("modality", "unknown"), Modality.UNKNOWN),
+            {} if provenance is None else provenance,
         )
 
 
+class _LazyContentHash:
+    """
+    Descriptor backing Matrix.hash.
+    
+    Serves as the dataclass field default, so an explicit ``hash=`` is stored
+    as-is; otherwise the content hash is computed from the cells on first
+    access and cached on the instance.
+    """
+    
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        if obj is None:
+            return None  # Field default seen by @dataclass
+        value = obj.__dict__.get("_hash")
+        if value is None:
+            value = obj.__dict__["_hash"] = content_hash(obj.cells)
+        return value
+    
+    def __set__(self, obj: Any, value: Optional[str]) -> None:
+        obj.__dict__["_hash"] = value
+
+
 @dataclass
 class Matrix:
     """
@@ -112,7 +169,7 @@ class Matrix:
         station: Station where matrix was created
         shape: (rows, cols) tuple
         cells: List of cells in matrix
-        hash: Content hash for integrity
+        hash: Content hash for integrity (computed from cells when omitted)
         metadata: Additional matrix metadata
     """
     id: str
@@ -120,13 +177,26 @@ class Matrix:
     station: str
     shape: tuple[int, int]
     cells: List[Cell]
-    hash: str
+    hash: str = _LazyContentHash()  # type: ignore[assignment]
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Set by validate_matrix on success so station handoffs skip re-validation
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Names and stations come from a tiny alphabet; share one str object each
+        self.name = _intern(self.name)
+        self.station = _intern(self.station)
+    
+    def invalidate(self) -> None:
+        """Drop cached validation and content hash; call after mutating cells."""
+        self._validated = False
+        self.__dict__["_hash"] = None
     
     @property
     def type(self) -> MatrixType:
         """Get matrix type from name for compatibility."""
-        return MatrixType(self.name)
+        # Fall back to the Enum constructor so unknown names still raise ValueError
+        return _MATRIX_TYPE_BY_VALUE.get(self.name) or MatrixType(self.name)
     
     @property
     def dimensions(self) -> tuple[int, int]:
@@ -140,20 +210,27 @@ class Matrix:
                 return cell
         return None
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert matrix to dictionary for serialization."""
-        return {
+    def to_dict(self, include_legacy: bool = True) -> Dict[str, Any]:
+        """
+        Convert matrix to dictionary for serialization.
+        
+        Args:
+            include_legacy: Also emit legacy ``type``/``dimensions`` keys
+                (and ``content`` on every cell)
+        """
+        data = {
             "id": self.id,
             "name": self.name,
             "station": self.station,
             "shape": list(self.shape),
-            "cells": [cell.to_dict() for cell in self.cells],
+            "cells": [cell.to_dict(include_legacy) for cell in self.cells],
             "hash": self.hash,
             "metadata": self.metadata,
-            # Legacy compatibility
-            "type": self.name,
-            "dimensions": list(self.shape)
         }
+        if include_legacy:
+            data["type"] = self.name
+            data["dimensions"] = list(self.shape)
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Matrix":
@@ -162,15 +239,22 @@ class Matrix:
         shape = tuple(data.get("shape") or data.get("dimensions", [0, 0]))
         name = data.get("name") or data.get("type", "X")
         station = data.get("station", "unknown")
-        hash_val = data.get("hash", "unknown")
+        
+        # Decide the cell schema once rather than re-branching per cell
+        cell_data = data["cells"]
+        if all("value" in c for c in cell_data):
+            cells = [Cell._from_canonical(c) for c in cell_data]
+        else:
+            cells = [Cell.from_dict(c) for c in cell_data]
         
         return cls(
             id=data["id"],
             name=name,
             station=station,
             shape=shape,
-            cells=[Cell.from_dict(c) for c in data["cells"]],
-            hash=hash_val,
+            cells=cells,
+            # None leaves the hash to be computed from the cells on access
+            hash=data.get("hash"),  # type: ignore[arg-type]
             metadata=data.get("metadata", {})
         )
 
@@ -189,11 +273,11 @@ class Tensor:
     matrices: List[Matrix]
     depth: int
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_legacy: bool = True) -> Dict[str, Any]:
         """Convert tensor to dictionary."""
         return {
             "id": self.id,
-            "matrices": [m.to_dict() for m in self.matrices],
+            "matrices": [m.to_dict(include_legacy) for m in self.matrices],
             "depth": self.depth
         }
 
@@ -222,6 +306,9 @@ class Operation:
     timestamp: str
     output_hash: str
     
+    def __post_init__(self) -> None:
+        self.kind = _intern(self.kind)
+    
     @property
     def type(self) -> str:
         """Legacy property for compatibility."""
@@ -232,9 +319,9 @@ class Operation:
         """Legacy property for compatibility."""
         return [self.output]
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_legacy: bool = True) -> Dict[str, Any]:
         """Convert operation to dictionary."""
-        return {
+        data = {
             "id": self.id,
             "kind": self.kind,
             "inputs": self.inputs,
@@ -243,10 +330,11 @@ class Operation:
             "prompt_hash": self.prompt_hash,
             "timestamp": self.timestamp,
             "output_hash": self.output_hash,
-            # Legacy compatibility
-            "type": self.kind,
-            "outputs": [self.output]
         }
+        if include_legacy:
+            data["type"] = self.kind
+            data["outputs"] = [self.output]
+        return data
 
 
 @dataclass
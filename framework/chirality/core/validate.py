@@ -4,15 +4,44 @@ Validation rules for CF14 semantic structures.
 Enforces dimensional constraints, modality alignment, and operation sequencing.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from .types import Cell, Matrix, MatrixType, Modality
 
 
+# Enum containment walks the members; frozenset lookups are O(1). Members hash
+# by name, so raw values are included for str modalities/names as well.
+_VALID_MODALITIES = frozenset(Modality) | frozenset(m.value for m in Modality)
+_VALID_MATRIX_NAMES = frozenset(t.value for t in MatrixType)
+
+
 class CF14ValidationError(ValueError):
     """Raised when CF14 validation rules are violated."""
     pass
 
 
+def _cols_match_rows(a: Tuple[int, int], b: Tuple[int, int]) -> Optional[str]:
+    return None if a[1] == b[0] else f"{a} × {b}"
+
+
+def _same_shape(a: Tuple[int, int], b: Tuple[int, int]) -> Optional[str]:
+    return None if a == b else f"{a} vs {b}"
+
+
+_MULTIPLY_REQUIRES = "Matrix multiplication requires A.cols == B.rows"
+_SAME_DIMS_REQUIRES = "Operation {op} requires same dimensions"
+
+# Dimension rule per operation, under both the symbol and the word form:
+# (shape check returning the mismatch or None, ensure_dims message template,
+#  noun used in validate_matrix_dimensions messages)
+_DIM_RULES = {
+    "*": (_cols_match_rows, _MULTIPLY_REQUIRES, "multiplication"),
+    "multiply": (_cols_match_rows, _MULTIPLY_REQUIRES, "multiplication"),
+    "+": (_same_shape, _SAME_DIMS_REQUIRES, "addition"),
+    "add": (_same_shape, _SAME_DIMS_REQUIRES, "addition"),
+    "⊙": (_same_shape, _SAME_DIMS_REQUIRES, "element-wise operation"),
+}
+
+
 def ensure_dims(A: Matrix, B: Matrix, op: str) -> None:
     """
     Ensure matrix dimensions are compatible for operation.
@@ -25,16 +54,13 @@ def ensure_dims(A: Matrix, B: Matrix, op: str) -> None:
     Raises:
         CF14ValidationError: If dimensions incompatible
     """
-    if op == "*":
-        if A.shape[1] != B.shape[0]:
-            raise CF14ValidationError(
-                f"Matrix multiplication requires A.cols == B.rows, got {A.shape} × {B.shape}"
-            )
-    elif op in ["+", "⊙"]:
-        if A.shape != B.shape:
-            raise CF14ValidationError(
-                f"Operation {op} requires same dimensions, got {A.shape} vs {B.shape}"
-            )
+    rule = _DIM_RULES.get(op)
+    if rule is None:
+        return
+    check, requires, _ = rule
+    mismatch = check(A.shape, B.shape)
+    if mismatch is not None:
+        raise CF14ValidationError(f"{requires.format(op=op)}, got {mismatch}")
 
 
 def ensure_same_rows_cols(A: Matrix, B: Matrix, op: str) -> None:
@@ -85,30 +111,72 @@ def validate_cell(cell: Cell) -> List[str]:
         errors.append("Cell content missing 'text' field")
     
     # Validate modality
-    if cell.modality not in Modality:
+    if cell.modality not in _VALID_MODALITIES:
         errors.append(f"Invalid modality: {cell.modality}")
     
     return errors
 
 
-def validate_matrix(matrix: Matrix) -> List[str]:
+# Largest grid (rows * cols) tracked with a bytearray; sparser huge grids use a set
+_BITMAP_MAX_CELLS = 1 << 24
+
+
+def _cells_look_valid(cells: List[Cell], rows: int, cols: int) -> bool:
+    """
+    Check every per-cell rule with a few whole-list scans.
+    
+    True means validate_cell, the bounds check and the duplicate check would
+    all report nothing for these cells.
+    """
+    if not cells:
+        return True
+    cell_rows = [cell.row for cell in cells]
+    cell_cols = [cell.col for cell in cells]
+    if min(cell_rows) < 0 or max(cell_rows) >= rows:
+        return False
+    if min(cell_cols) < 0 or max(cell_cols) >= cols:
+        return False
+    # Bounds hold, so every position has a unique flat index into the grid
+    flat = [row * cols + col for row, col in zip(cell_rows, cell_cols)]
+    if rows * cols <= _BITMAP_MAX_CELLS:
+        # One byte per grid position: C-level stores and a single count
+        seen = bytearray(rows * cols)
+        for idx in flat:
+            seen[idx] = 1
+        if seen.count(1) != len(cells):
+            return False
+    elif len(set(flat)) != len(cells):
+        return False
+    if not all([cell.id for cell in cells]):
+        return False
+    return {cell.modality for cell in cells} <= _VALID_MODALITIES
+
+
+def validate_matrix(matrix: Matrix, fast: bool = False) -> List[str]:
     """
     Validate a matrix structure.
     
     Args:
         matrix: Matrix to validate
+        fast: Return as soon as the first error is found (for callers that
+            only need to know whether the matrix is valid)
     
     Returns:
         List of validation errors (empty if valid)
     """
+    # Already passed and not mutated since (see Matrix.invalidate)
+    if matrix._validated:
+        return []
+    
     errors = []
     
     # Check required fields
     if not matrix.id:
         errors.append("Matrix missing ID")
     
-    if matrix.type not in MatrixType:
-        errors.append(f"Invalid matrix type: {matrix.type}")
+    # Check the name directly: matrix.type raises for unknown names
+    if matrix.name not in _VALID_MATRIX_NAMES:
+        errors.append(f"Invalid matrix type: {matrix.name}")
     
     # Validate dimensions
     rows, cols = matrix.dimensions
@@ -119,6 +187,15 @@ def validate_matrix(matrix: Matrix) -> List[str]:
     if not matrix.cells:
         errors.append("Matrix has no cells")
     
+    if fast and errors:
+        return errors
+    
+    # Bulk structural scan first; the per-cell walk below only runs to produce
+    # detailed messages when something is actually wrong
+    if _cells_look_valid(matrix.cells, rows, cols):
+        matrix._validated = not errors
+        return errors
+    
     cell_positions = set()
     for cell in matrix.cells:
         # Validate individual cell
@@ -134,6 +211,9 @@ def validate_matrix(matrix: Matrix) -> List[str]:
         if pos in cell_positions:
             errors.append(f"Duplicate cell at position {pos}")
         cell_positions.add(pos)
+        
+        if fast and errors:
+            return errors
     
     return errors
 
@@ -181,22 +261,41 @@ def validate_modality_alignment(matrix_a: Matrix, matrix_b: Matrix) -> List[str]
     Returns:
         List of validation errors
     """
-    errors = []
+    errors: List[str] = []
     
-    # Get modality distributions
-    modalities_a = {cell.modality for cell in matrix_a.cells}
-    modalities_b = {cell.modality for cell in matrix_b.cells}
+    # Only four modalities matter; stop scanning each matrix once it has
+    # shown every one it can contribute
+    axioms_a, values_a = _has_modalities(matrix_a, Modality.AXIOM, Modality.VALUE)
+    if not (axioms_a or values_a):
+        return errors
+    instances_b, theories_b = _has_modalities(matrix_b, Modality.INSTANCE, Modality.THEORY)
     
     # Check compatibility based on CF14 rules
-    if Modality.AXIOM in modalities_a and Modality.INSTANCE in modalities_b:
+    if axioms_a and instances_b:
         errors.append("Cannot multiply axioms with instances directly")
     
-    if Modality.VALUE in modalities_a and Modality.THEORY in modalities_b:
+    if values_a and theories_b:
         errors.append("Cannot multiply values with theories directly")
     
     return errors
 
 
+def _has_modalities(matrix: Matrix, first: Modality, second: Modality) -> Tuple[bool, bool]:
+    """Report whether any cell has each of two modalities, exiting early."""
+    has_first = has_second = False
+    for cell in matrix.cells:
+        modality = cell.modality
+        if modality is first:
+            has_first = True
+        elif modality is second:
+            has_second = True
+        else:
+            continue
+        if has_first and has_second:
+            break
+    return has_first, has_second
+
+
 def validate_matrix_dimensions(matrix_a: Matrix, matrix_b: Matrix, operation: str) -> List[str]:
     """
     Validate matrix dimensions for operations.
@@ -204,30 +303,19 @@ def validate_matrix_dimensions(matrix_a: Matrix, matrix_b: Matrix, operation: st
     Args:
         matrix_a: First matrix
         matrix_b: Second matrix
-        operation: Operation type (multiply, add)
+        operation: Operation type (multiply, add, or the symbols *, +, ⊙)
     
     Returns:
         List of validation errors
     """
-    errors = []
-    
-    if operation == "multiply":
-        # For multiplication: A.cols must equal B.rows
-        if matrix_a.dimensions[1] != matrix_b.dimensions[0]:
-            errors.append(
-                f"Incompatible dimensions for multiplication: "
-                f"{matrix_a.dimensions} × {matrix_b.dimensions}"
-            )
-    
-    elif operation == "add":
-        # For addition: dimensions must match exactly
-        if matrix_a.dimensions != matrix_b.dimensions:
-            errors.append(
-                f"Incompatible dimensions for addition: "
-                f"{matrix_a.dimensions} vs {matrix_b.dimensions}"
-            )
-    
-    return errors
+    rule = _DIM_RULES.get(operation)
+    if rule is None:
+        return []
+    check, _, noun = rule
+    mismatch = check(matrix_a.dimensions, matrix_b.dimensions)
+    if mismatch is None:
+        return []
+    return [f"Incompatible dimensions for {noun}: {mismatch}"]
 
 
 def validate_provenance(cell: Cell) -> List[str]:
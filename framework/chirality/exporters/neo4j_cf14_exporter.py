@@ -1,15 +1,161 @@
 import os
 from hashlib import sha1
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 try:
     from neo4j import GraphDatabase  # type: ignore
 except Exception:  # pragma: no cover
     GraphDatabase = None  # type: ignore
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional vectorized scan
+    np = None  # type: ignore
+try:
+    from numba import njit, prange  # type: ignore
+except ImportError:  # pragma: no cover - optional JIT scan for very large matrices
+    njit = None  # type: ignore
 from datetime import datetime
 
 def _sha(s: str) -> str:
     return sha1(s.encode("utf-8")).hexdigest()
 
+# Below this many cells np.nonzero wins; the JIT kernel also pays a one-off compile
+_NUMBA_MIN_CELLS = 1_000_000
+
+if np is not None and njit is not None:
+    @njit(parallel=True, cache=True)
+    def _pack_cells(arr):  # pragma: no cover - compiled
+        """Row-major non-zero (rows, cols, weights) of a 2D float64 array, rows scanned in parallel."""
+        n_rows, n_cols = arr.shape
+        # Pass 1: count per row so every row knows where its output slice starts
+        counts = np.zeros(n_rows + 1, dtype=np.int64)
+        for i in prange(n_rows):
+            found = 0
+            for j in range(n_cols):
+                if arr[i, j] != 0.0:
+                    found += 1
+            counts[i + 1] = found
+        offsets = np.cumsum(counts)
+        total = offsets[n_rows]
+        nz_i = np.empty(total, dtype=np.int64)
+        nz_j = np.empty(total, dtype=np.int64)
+        weights = np.empty(total, dtype=np.float64)
+        # Pass 2: each row fills its own slice, no synchronisation needed
+        for i in prange(n_rows):
+            k = offsets[i]
+            for j in range(n_cols):
+                w = arr[i, j]
+                if w != 0.0:
+                    nz_i[k] = i
+                    nz_j[k] = j
+                    weights[k] = w
+                    k += 1
+        return nz_i, nz_j, weights
+else:
+    _pack_cells = None
+
+def _nonzero_cells_numpy(matrix: Any) -> Optional[Tuple[List[int], List[int], List[float], int]]:
+    """Non-zero (rows, cols, weights, width) of a numeric rectangular matrix; None if not one."""
+    try:
+        arr = np.asarray(matrix)
+        if arr.dtype == object:
+            return None  # None or mixed-type cells; the generic scan skips them per cell
+        arr = arr.astype(np.float64, copy=False)
+    except (TypeError, ValueError):
+        return None  # Ragged or non-numeric; the generic scan handles it
+    if arr.ndim != 2:
+        return None
+    if _pack_cells is not None and arr.size >= _NUMBA_MIN_CELLS:
+        nz_i, nz_j, weights = _pack_cells(np.ascontiguousarray(arr))
+        return nz_i.tolist(), nz_j.tolist(), weights.tolist(), arr.shape[1]
+    nz_i, nz_j = np.nonzero(arr)
+    return nz_i.tolist(), nz_j.tolist(), arr[nz_i, nz_j].tolist(), arr.shape[1]
+
+def _nonzero_cells(matrix: Any) -> Tuple[List[int], List[int], List[float], int]:
+    """Non-zero (rows, cols, weights, width) of a 2D structure; unparseable values are skipped."""
+    if np is not None:
+        found = _nonzero_cells_numpy(matrix)
+        if found is not None:
+            return found
+    nz_i: List[int] = []
+    nz_j: List[int] = []
+    weights: List[float] = []
+    width = 0
+    for i, row in enumerate(matrix):
+        width = max(width, len(row))
+        for j, val in enumerate(row):
+            try:
+                # Structural zeros are the common case; skip them before float()
+                if val is None or val == 0:
+                    continue
+                weight = float(val)
+            except Exception:
+                continue
+            if weight == 0.0:
+                continue
+            nz_i.append(i)
+            nz_j.append(j)
+            weights.append(weight)
+    return nz_i, nz_j, weights, width
+
+# One statement per export: every matrix node arrives in $ms as {id, kind, name, rows, cols}
+_MERGE_MATRICES = """
+UNWIND $ms AS r
+MERGE (m:CFMatrix {id: r.id})
+ON CREATE SET m.createdAt = $now
+SET m.kind = r.kind, m.name = r.name,
+    m.updatedAt = $now,
+    m.rows = r.rows, m.cols = r.cols
+"""
+
+# Per-cell write, with the cell bound to r and $mid/$kind naming its matrix
+_CELL_BODY = """
+MATCH (m:CFMatrix {id: $mid})
+MERGE (a:CFNode {id: r.aid})
+  ON CREATE SET a.term = 'Row' + toString(r.i), a.station = $kind, a.type = 'row', a.row = r.i
+  SET a.station = $kind
+MERGE (b:CFNode {id: r.bid})
+  ON CREATE SET b.term = 'Col' + toString(r.j), b.station = $kind, b.type = 'col', b.col = r.j
+  SET b.station = $kind
+MERGE (m)-[:CONTAINS]->(a)
+MERGE (m)-[:CONTAINS]->(b)
+MERGE (a)-[rel:RELATES_TO]->(b)
+SET rel.weight = r.w
+"""
+
+# One statement per matrix: every non-zero cell arrives in $rows as {i, j, w, aid, bid}
+_MERGE_CELLS = "\nUNWIND $rows AS r" + _CELL_BODY
+
+# Very large matrices: APOC commits the same per-cell write in batches instead
+# of holding every cell in one transaction. Batches run serially because
+# concurrent MERGEs on shared row/col nodes can deadlock.
+_APOC_MERGE_CELLS = """
+CALL apoc.periodic.iterate(
+  'UNWIND $rows AS r RETURN r',
+  $body,
+  {batchSize: $batchSize, parallel: false, params: {rows: $rows, mid: $mid, kind: $kind}}
+)
+YIELD failedBatches, errorMessages
+RETURN failedBatches, errorMessages
+"""
+
+# Cells per matrix above which APOC batching is tried, and its batch size
+_APOC_MIN_ROWS = 10_000
+_APOC_BATCH_SIZE = 5_000
+
+def _write_cells(tx: Any, cell_batches: List[Tuple[str, str, List[Dict[str, Any]]]]) -> None:
+    """Transaction function: each matrix's cells as one UNWIND statement."""
+    for matrix_id, kind, rows_payload in cell_batches:
+        tx.run(_MERGE_CELLS, rows=rows_payload, mid=matrix_id, kind=kind)
+
+def _write_export(tx: Any, matrix_rows: List[Dict[str, Any]],
+                  cell_batches: List[Tuple[str, str, List[Dict[str, Any]]]], now: str) -> None:
+    """Transaction function: all matrix nodes in one statement, then each matrix's cells."""
+    tx.run(_MERGE_MATRICES, ms=matrix_rows, now=now)
+    _write_cells(tx, cell_batches)
+
+# URIs whose constraints were already created by this process
+_SCHEMA_READY: Set[str] = set()
+
 class CF14Neo4jExporter:
     """
     Minimal, idempotent write-layer for CF14 outputs.
@@ -20,19 +166,31 @@ class CF14Neo4jExporter:
       (:CFNode {id, term, station, type, row?, col?})
       (m)-[:CONTAINS]->(n)
       (a)-[:RELATES_TO {weight}]->(b)
+
+    Use as a context manager to share one session across several exports:
+
+        with CF14Neo4jExporter(uri) as exporter:
+            exporter.export(matrices, thread_id)
     """
     def __init__(self, uri: Optional[str] = None, user: Optional[str] = None, password: Optional[str] = None) -> None:
         # Prefer provided CLI args; fall back to env vars; keep sensible defaults
-        uri = uri or os.getenv("NEO4J_URI", "bolt://localhost:7687")
+        uri = uri or os.getenv("NEO4J_URI") or "bolt://localhost:7687"
         user = user or os.getenv("NEO4J_USER", os.getenv("NEO4J_USERNAME", "neo4j"))
         pwd  = password or os.getenv("NEO4J_PASSWORD", "password")
         if GraphDatabase is None:
             raise ImportError("neo4j package required. Install with: pip install neo4j or use extra [neo4j]")
         self.driver = GraphDatabase.driver(uri, auth=(user, pwd))
-        self._ensure_schema()
+        self._session: Any = None
+        # Whether apoc.periodic.iterate is callable; unknown until first needed
+        self._apoc: Optional[bool] = None
+        # Constraints are idempotent; creating them once per process is enough
+        # (only once every statement succeeded, so failures are retried)
+        if uri not in _SCHEMA_READY and self._ensure_schema():
+            _SCHEMA_READY.add(uri)
 
-    def _ensure_schema(self) -> None:
-        """Create required constraints/indexes for idempotent upserts."""
+    def _ensure_schema(self) -> bool:
+        """Create required constraints/indexes for idempotent upserts; True if all succeeded."""
+        ok = True
         with self.driver.session() as session:
             statements = [
                 "CREATE CONSTRAINT IF NOT EXISTS FOR (m:CFMatrix) REQUIRE m.id IS UNIQUE",
@@ -43,70 +201,100 @@ class CF14Neo4jExporter:
                     session.run(stmt)
                 except Exception:
                     # Best-effort; ignore if not supported
-                    pass
+                    ok = False
+        return ok
 
     def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
         self.driver.close()
 
-    def export(self, matrices: Dict[str, Any], thread_id: str) -> None:
+    def __enter__(self) -> "CF14Neo4jExporter":
+        self._session = self.driver.session()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def export(self, matrices: Dict[str, Any], thread_id: str, session: Any = None) -> None:
         """
         `matrices` is expected as a dict: {'A': matrixA, 'B': matrixB, ...}
         Each matrix can be a 2D list/ndarray-like structure. Zeros are skipped.
+        Writes go through `session` if given, else the context-managed session,
+        else a short-lived one; they run as one managed (retried) transaction.
         """
         now = datetime.utcnow().isoformat()
+        matrix_rows: List[Dict[str, Any]] = []
+        cell_batches: List[Tuple[str, str, List[Dict[str, Any]]]] = []
+        for kind, matrix in matrices.items():
+            # Basic dimensions from provided 2D structure
+            rows = len(matrix) if hasattr(matrix, "__len__") else 0
+            cols = len(matrix[0]) if rows > 0 and hasattr(matrix[0], "__len__") else 0
+
+            matrix_id = _sha(f"{thread_id}|{kind}")
+            if not hasattr(matrix, "__len__"):
+                matrix = list(matrix)
+            nz_i, nz_j, weights, width = _nonzero_cells(matrix)
+
+            # Derive row/col node ids deterministically, once per row and per column
+            row_ids = [_sha(f"{thread_id}|{kind}|row|{i}") for i in range(len(matrix))]
+            col_ids = [_sha(f"{thread_id}|{kind}|col|{j}") for j in range(width)]
+
+            matrix_rows.append({
+                "id": matrix_id,
+                "kind": kind,
+                "name": f"{thread_id} {kind}",
+                "rows": rows,
+                "cols": cols,
+            })
+            rows_payload = [
+                {"i": i, "j": j, "w": w, "aid": row_ids[i], "bid": col_ids[j]}
+                for i, j, w in zip(nz_i, nz_j, weights)
+            ]
+            if rows_payload:
+                cell_batches.append((matrix_id, kind, rows_payload))
+
+        if not matrix_rows:
+            return
+        session = session or self._session
+        if session is not None:
+            self._write(session, matrix_rows, cell_batches, now)
+            return
         with self.driver.session() as session:
-            for kind, matrix in matrices.items():
-                # Basic dimensions from provided 2D structure
-                rows = len(matrix) if hasattr(matrix, "__len__") else 0
-                cols = len(matrix[0]) if rows > 0 and hasattr(matrix[0], "__len__") else 0
-
-                matrix_id = _sha(f"{thread_id}|{kind}")
-                session.run(
-                    """
-                    MERGE (m:CFMatrix {id: $id})
-                    ON CREATE SET m.createdAt = $createdAt
-                    SET m.kind = $kind, m.name = $name,
-                        m.updatedAt = $updatedAt,
-                        m.rows = $rows, m.cols = $cols
-                    """,
-                    id=matrix_id,
-                    createdAt=now,
-                    updatedAt=now,
-                    kind=kind,
-                    name=f"{thread_id} {kind}",
-                    rows=rows,
-                    cols=cols,
-                )
-                # Derive row/col node ids deterministically and link non-zero weights
-                for i, row in enumerate(matrix):
-                    for j, val in enumerate(row):
-                        try:
-                            weight = float(val)
-                        except Exception:
-                            continue
-                        if weight == 0.0:
-                            continue
-                        node_a_id = _sha(f"{thread_id}|{kind}|row|{i}")
-                        node_b_id = _sha(f"{thread_id}|{kind}|col|{j}")
-                        session.run(
-                            """
-                            MATCH (m:CFMatrix {id: $mid})
-                            MERGE (a:CFNode {id: $aid})
-                              ON CREATE SET a.term = $term_a, a.station = $kind, a.type = 'row', a.row = $i
-                              SET a.station = $kind
-                            MERGE (b:CFNode {id: $bid})
-                              ON CREATE SET b.term = $term_b, b.station = $kind, b.type = 'col', b.col = $j
-                              SET b.station = $kind
-                            MERGE (m)-[:CONTAINS]->(a)
-                            MERGE (m)-[:CONTAINS]->(b)
-                            MERGE (a)-[r:RELATES_TO]->(b)
-                              ON CREATE SET r.weight = $w
-                              ON MATCH  SET r.weight = $w
-                            """,
-                            mid=matrix_id,
-                            aid=node_a_id, term_a=f"Row{i}",
-                            bid=node_b_id, term_b=f"Col{j}",
-                            i=i, j=j,
-                            kind=kind,
-                            w=weight,
-                        )
\ No newline at end of file
+            self._write(session, matrix_rows, cell_batches, now)
+
+    def _write(self, session: Any, matrix_rows: List[Dict[str, Any]],
+               cell_batches: List[Tuple[str, str, List[Dict[str, Any]]]], now: str) -> None:
+        """Write matrix nodes and small matrices in one transaction, then very large ones via APOC."""
+        large = [b for b in cell_batches if len(b[2]) > _APOC_MIN_ROWS] if self._apoc is not False else []
+        small = [b for b in cell_batches if len(b[2]) <= _APOC_MIN_ROWS] if large else cell_batches
+        # Matrix nodes must be committed before APOC's own transactions can MATCH them
+        session.execute_write(_write_export, matrix_rows, small, now)
+        for batch in large:
+            if not self._merge_cells_apoc(session, *batch):
+                session.execute_write(_write_cells, [batch])
+
+    def _merge_cells_apoc(self, session: Any, matrix_id: str, kind: str,
+                          rows_payload: List[Dict[str, Any]]) -> bool:
+        """Write one matrix's cells with apoc.periodic.iterate; False if APOC is unavailable."""
+        if self._apoc is False:
+            return False
+        try:
+            record = session.run(
+                _APOC_MERGE_CELLS,
+                body=_CELL_BODY,
+                batchSize=_APOC_BATCH_SIZE,
+                rows=rows_payload,
+                mid=matrix_id,
+                kind=kind,
+            ).single()
+        except Exception as exc:
+            if "ProcedureNotFound" not in str(getattr(exc, "code", "")):
+                raise
+            self._apoc = False
+            return False
+        self._apoc = True
+        if record and record["failedBatches"]:
+            raise RuntimeError(f"APOC cell export failed for {kind}: {record['errorMessages']}")
+        return True
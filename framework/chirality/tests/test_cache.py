@@ -0,0 +1,43 @@
+"""Tests for the CF14 prompt response cache."""
+
+from chirality.core.cache import PromptCache
+
+
+def test_prompt_cache_lru_eviction():
+    """Test that the least recently used entry is evicted first."""
+    cache = PromptCache(maxsize=2)
+    cache.put("a", {"text": "A"})
+    cache.put("b", {"text": "B"})
+    cache.get("a")
+    cache.put("c", {"text": "C"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"text": "A"}
+    assert cache.get("c") == {"text": "C"}
+    assert len(cache) == 2
+
+
+def test_prompt_cache_returns_copies():
+    """Test that mutating a returned response does not alter the cache."""
+    cache = PromptCache()
+    response = {"text": "original", "terms_used": ["a"], "warnings": []}
+    cache.put("k", response)
+
+    response["terms_used"].append("from caller")
+    cached = cache.get("k")
+    cached["text"] = "changed"
+    cached["terms_used"].append("b")
+    cached["warnings"].append("w")
+
+    assert cache.get("k") == {"text": "original", "terms_used": ["a"], "warnings": []}
+
+
+def test_prompt_cache_disk_tier(tmp_path):
+    """Test that responses persist in the directory tier across instances."""
+    PromptCache(directory=tmp_path).put("k", {"text": "T", "terms_used": ["x"], "warnings": []})
+
+    fresh = PromptCache(directory=tmp_path)
+
+    assert fresh.get("k") == {"text": "T", "terms_used": ["x"], "warnings": []}
+    assert fresh.get("missing") is None
+    assert (fresh.hits, fresh.misses) == (1, 1)
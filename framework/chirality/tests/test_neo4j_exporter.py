@@ -0,0 +1,206 @@
+"""Tests for the CF14 Neo4j exporter, run against a stub driver."""
+
+import pytest
+
+from chirality.exporters import neo4j_cf14_exporter as exporter_module
+from chirality.exporters.neo4j_cf14_exporter import (
+    CF14Neo4jExporter,
+    _CELL_BODY,
+    _MERGE_CELLS,
+    _MERGE_MATRICES,
+    _nonzero_cells,
+    _sha,
+)
+
+
+class ProcedureNotFound(Exception):
+    """Stand-in for the driver's ClientError when APOC is not installed."""
+    code = "Neo.ClientError.Procedure.ProcedureNotFound"
+
+
+class StubResult:
+    def __init__(self, record):
+        self.record = record
+
+    def single(self):
+        return self.record
+
+
+class StubTx:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def run(self, query, **params):
+        self.driver.log.append(("tx", query, params))
+
+
+class StubSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def run(self, query, **params):
+        self.driver.log.append(("run", query, params))
+        if "apoc.periodic.iterate" in query:
+            if not self.driver.apoc:
+                raise ProcedureNotFound()
+            return StubResult({"failedBatches": 0, "errorMessages": {}})
+        if "CONSTRAINT" in query and self.driver.schema_error:
+            raise RuntimeError("constraint creation failed")
+        return StubResult(None)
+
+    def execute_write(self, fn, *args):
+        result = fn(StubTx(self.driver), *args)
+        self.driver.log.append(("commit", None, {}))
+        return result
+
+    def close(self):
+        self.driver.closed += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class StubDriver:
+    def __init__(self):
+        self.log = []
+        self.sessions = 0
+        self.closed = 0
+        self.apoc = True
+        self.schema_error = False
+
+    def session(self, **kwargs):
+        self.sessions += 1
+        return StubSession(self)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def driver(monkeypatch):
+    """Route GraphDatabase.driver to one StubDriver and reset per-process schema state."""
+    stub = StubDriver()
+
+    class StubGraphDatabase:
+        @staticmethod
+        def driver(uri, auth=None):
+            return stub
+
+    monkeypatch.setattr(exporter_module, "GraphDatabase", StubGraphDatabase)
+    monkeypatch.setattr(exporter_module, "_SCHEMA_READY", set())
+    return stub
+
+
+def writes(driver):
+    """Logged (kind, query, params) entries after schema setup."""
+    return [entry for entry in driver.log if "CONSTRAINT" not in (entry[1] or "")]
+
+
+@pytest.mark.parametrize("matrix", [
+    [[0, 1.5, 0], [2, 0, -3]],
+    [[None, 1, 0], [2, None, "3"]],
+    [[1, "2", 0], ["0", 3.5, True]],
+    [["x", 1], [0, 2]],
+    [[1, 2], [3]],
+    [[1, float("nan")], [0, 2]],
+])
+def test_nonzero_cells_numpy_matches_python(monkeypatch, matrix):
+    """Test that the NumPy scan finds exactly what the pure-Python scan finds."""
+    pytest.importorskip("numpy")
+    vectorized = _nonzero_cells(matrix)
+    monkeypatch.setattr(exporter_module, "np", None)
+    generic = _nonzero_cells(matrix)
+
+    # repr() so NaN weights compare equal
+    assert repr(vectorized) == repr(generic)
+
+
+def test_nonzero_cells_skips_none():
+    """Test that None cells are never exported as weights."""
+    nz_i, nz_j, weights, width = _nonzero_cells([[None, 1, 0], [2, None, "3"]])
+
+    assert list(zip(nz_i, nz_j, weights)) == [(0, 1, 1.0), (1, 0, 2.0), (1, 2, 3.0)]
+    assert width == 3
+
+
+def test_export_writes_one_transaction(driver):
+    """Test that all matrix nodes and cell batches go through one execute_write."""
+    CF14Neo4jExporter().export({"A": [[1, 0], [0, 2]], "B": [[0, 0]], "C": [[0, 3]]}, "t")
+
+    log = writes(driver)
+    assert [entry[0] for entry in log] == ["tx", "tx", "tx", "commit"]
+
+    _, query, params = log[0]
+    assert query == _MERGE_MATRICES
+    assert [m["kind"] for m in params["ms"]] == ["A", "B", "C"]
+    assert params["ms"][0] == {"id": _sha("t|A"), "kind": "A", "name": "t A", "rows": 2, "cols": 2}
+
+    _, query, params = log[1]
+    assert query == _MERGE_CELLS
+    assert params["mid"] == _sha("t|A") and params["kind"] == "A"
+    assert params["rows"] == [
+        {"i": 0, "j": 0, "w": 1.0, "aid": _sha("t|A|row|0"), "bid": _sha("t|A|col|0")},
+        {"i": 1, "j": 1, "w": 2.0, "aid": _sha("t|A|row|1"), "bid": _sha("t|A|col|1")},
+    ]
+    # B has no non-zero cells, so only C follows
+    assert log[2][2]["kind"] == "C"
+
+
+def test_export_context_manager_reuses_session(driver):
+    """Test that exports inside a with-block share the exporter's session."""
+    with CF14Neo4jExporter() as exporter:
+        opened = driver.sessions
+        exporter.export({"A": [[1]]}, "t")
+        exporter.export({"B": [[2]]}, "t")
+        assert driver.sessions == opened
+        closed = driver.closed
+
+    assert [entry[0] for entry in writes(driver)] == ["tx", "tx", "commit", "tx", "tx", "commit"]
+    assert driver.closed == closed + 1
+
+
+def test_export_large_matrix_uses_apoc(driver, monkeypatch):
+    """Test that matrices above the threshold are written with apoc.periodic.iterate."""
+    monkeypatch.setattr(exporter_module, "_APOC_MIN_ROWS", 2)
+    CF14Neo4jExporter().export({"A": [[1, 2], [3, 0]], "B": [[4]]}, "t")
+
+    log = writes(driver)
+    assert [entry[0] for entry in log] == ["tx", "tx", "commit", "run"]
+    assert log[1][2]["kind"] == "B"
+
+    _, query, params = log[3]
+    assert "apoc.periodic.iterate" in query and "parallel: false" in query
+    assert params["body"] == _CELL_BODY
+    assert params["mid"] == _sha("t|A") and len(params["rows"]) == 3
+
+
+def test_export_without_apoc_falls_back_to_unwind(driver, monkeypatch):
+    """Test that a missing APOC procedure falls back to UNWIND and is not retried."""
+    monkeypatch.setattr(exporter_module, "_APOC_MIN_ROWS", 2)
+    driver.apoc = False
+    exporter = CF14Neo4jExporter()
+    exporter.export({"A": [[1, 2], [3, 0]], "C": [[5, 6, 7]]}, "t")
+
+    log = writes(driver)
+    assert [entry[0] for entry in log] == ["tx", "commit", "run", "tx", "commit", "tx", "commit"]
+    assert [entry[2]["kind"] for entry in log if entry[1] == _MERGE_CELLS] == ["A", "C"]
+
+
+def test_schema_created_once_per_uri_and_retried_on_failure(driver):
+    """Test that constraints run once per URI, but again after a failed attempt."""
+    def schema_runs():
+        return sum(1 for entry in driver.log if "CONSTRAINT" in (entry[1] or ""))
+
+    driver.schema_error = True
+    CF14Neo4jExporter("bolt://stub:7687")
+    assert schema_runs() == 2
+
+    driver.schema_error = False
+    CF14Neo4jExporter("bolt://stub:7687")
+    assert schema_runs() == 4
+
+    CF14Neo4jExporter("bolt://stub:7687")
+    assert schema_runs() == 4
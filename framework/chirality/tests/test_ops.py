@@ -2,7 +2,7 @@
 
 import pytest
 from chirality.core.types import Matrix, Cell
-from chirality.core.ops import op_multiply, op_elementwise, op_interpret, EchoResolver
+from chirality.core.ops import op_multiply, op_elementwise, op_interpret, EchoResolver, _op_multiply_cell_by_cell
 from chirality.core.validate import CF14ValidationError
 
 
@@ -96,4 +96,119 @@ def test_echo_resolver_output_format():
     assert isinstance(result, list)
     assert len(result) == 2  # rows
     assert len(result[0]) == 2  # cols
-    assert all(isinstance(cell, str) for row in result for cell in row)
\ No newline at end of file
+    assert all(isinstance(cell, str) for row in result for cell in row)
+
+
+class RecordingCellResolver:
+    """Deterministic cell resolver that records the calls it receives."""
+    
+    model = "recording"
+    
+    def __init__(self):
+        self.calls = []
+    
+    def multiply_terms(self, term_a, term_b, station, row_label="", col_label=""):
+        self.calls.append("*")
+        return {"text": f"{term_a}*{term_b}"}
+    
+    def add_terms(self, products, station, row_label="", col_label=""):
+        self.calls.append("+")
+        return {"text": " + ".join(products)}
+    
+    def interpret_term(self, summed_text, station, row_label="", col_label=""):
+        self.calls.append("interpret")
+        return {"text": summed_text}
+
+
+def test_cell_by_cell_multiply_concurrent(monkeypatch):
+    """Test that concurrent cell dispatch keeps per-cell product order."""
+    monkeypatch.setenv("CF14_MAX_CONCURRENCY", "4")
+    A = create_test_matrix("A", (2, 3), "a")
+    B = create_test_matrix("B", (3, 2), "b")
+    resolver = RecordingCellResolver()
+    
+    C, op = _op_multiply_cell_by_cell("test_thread", A, B, resolver)
+    
+    cell = next(c for c in C.cells if (c.row, c.col) == (1, 0))
+    assert cell.value == "a_1_0*b_0_0 + a_1_1*b_1_0 + a_1_2*b_2_0"
+    assert C.metadata["cell_operations"] == 12
+    # All products are resolved before any addition starts
+    assert resolver.calls == ["*"] * 12 + ["+"] * 4
+
+
+def test_run_cell_calls_longest_first(monkeypatch):
+    """Test that long calls are submitted first while results keep submission order."""
+    from concurrent.futures import ThreadPoolExecutor
+    from chirality.core.ops import _run_cell_calls
+    
+    monkeypatch.setenv("CF14_MAX_CONCURRENCY", "2")
+    submitted = []
+    submit = ThreadPoolExecutor.submit
+    
+    def spy(self, fn, *args, **kwargs):
+        submitted.append(kwargs["text"])
+        return submit(self, fn, *args, **kwargs)
+    
+    monkeypatch.setattr(ThreadPoolExecutor, "submit", spy)
+    texts = ["a", "ccc", "bb", "dddd"]
+    results = _run_cell_calls([(lambda text: {"text": text}, {"text": t}) for t in texts])
+    
+    assert [r["text"] for r in results] == texts
+    assert submitted == ["dddd", "ccc", "bb", "a"]
+
+
+def test_run_cell_calls_cancels_queued_calls_on_failure(monkeypatch):
+    """Test that a failing call stops calls still waiting in the pool queue."""
+    import time
+    from chirality.core.ops import _run_cell_calls
+    
+    monkeypatch.setenv("CF14_MAX_CONCURRENCY", "2")
+    ran = []
+    
+    def call(text):
+        if text == "failing":
+            raise ValueError(text)
+        time.sleep(0.05)
+        ran.append(text)
+        return {"text": text}
+    
+    texts = ["failing"] + [f"c{i}" for i in range(10)]
+    with pytest.raises(ValueError):
+        _run_cell_calls([(call, {"text": t}) for t in texts])
+    
+    # At most the call on the other worker, and one picked up before cancellation
+    assert len(ran) <= 2
+
+
+def test_cell_by_cell_elementwise_labels(monkeypatch):
+    """Test that element-wise calls carry row-major row/col labels."""
+    from chirality.core.ops import _op_elementwise_cell_by_cell
+    
+    monkeypatch.setenv("CF14_MAX_CONCURRENCY", "1")
+    labels = []
+    
+    class LabelRecorder(RecordingCellResolver):
+        def multiply_terms(self, term_a, term_b, station, row_label="", col_label=""):
+            labels.append((row_label, col_label))
+            return super().multiply_terms(term_a, term_b, station, row_label, col_label)
+    
+    J = create_test_matrix("J", (2, 2), "j")
+    C = create_test_matrix("C", (2, 2), "c")
+    F, _ = _op_elementwise_cell_by_cell("t", J, C, LabelRecorder())
+    
+    assert labels == [("row_0", "col_0"), ("row_0", "col_1"), ("row_1", "col_0"), ("row_1", "col_1")]
+    assert F.cells[3].value == "j_1_1*c_1_1"
+
+
+def test_build_output_matrix_accepts_str_subclasses():
+    """Test that str subclasses (e.g. MatrixType members) are accepted, also when compiled."""
+    from chirality.core.ops import _build_output_matrix
+    from chirality.core.types import MatrixType
+    
+    class Thread(str):
+        pass
+    
+    C = _build_output_matrix(Thread("t"), MatrixType.C, "requirements", [["x", "y"]])
+    
+    assert C.type is MatrixType.C
+    assert [cell.value for cell in C.cells] == ["x", "y"]
@@ -0,0 +1,63 @@
+"""Tests for CF14 prompt templates."""
+
+from chirality.core.prompts import PromptBuilder, prompt_multiply, prompt_add, prompt_interpret
+
+
+def test_prompt_builder_matches_free_functions():
+    """Test that a reused builder renders the same prompts as one-shot calls."""
+    builder = PromptBuilder("", "Requirements")
+
+    for row, col in [("Normative", "Necessity"), ("Operative", "Sufficiency"), ("Normative", "Sufficiency")]:
+        assert builder.multiply(row, col, "a  term", "b") == prompt_multiply("", "Requirements", row, col, "a  term", "b")
+        assert builder.add(row, col, ["p1", "p2"]) == prompt_add("", "Requirements", row, col, ["p1", "p2"])
+        assert builder.interpret(row, col, "x") == prompt_interpret("", "Requirements", row, col, "x")
+
+    assert set(builder._labels) == {"Normative", "Operative", "Necessity", "Sufficiency"}
+
+
+def test_prompt_multiply_escapes_terms():
+    """Test that terms are normalized and escaped for embedding in quotes."""
+    prompt = prompt_multiply("Semantic Valley: A → [B]", "B", "r", "c", 'say  "hi"', "x")
+
+    assert '- "say \\"hi\\""' in prompt
+    assert '"terms_used": ["say \\"hi\\"","x"]' in prompt
+    assert "Valley map:\nSemantic Valley: A → [B]\n" in prompt
+
+
+def test_escape_matches_json_dumps():
+    """Test that the translate-table escaping matches json.dumps on random text."""
+    import json
+    import random
+    from chirality.core._text import escape_json_string
+
+    rng = random.Random(14)
+    alphabet = [chr(c) for c in range(0x30)] + list('\\"é→“”\u2028\x7f') + ["a", "Z"]
+    for _ in range(500):
+        s = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+        assert escape_json_string(s) == json.dumps(s, ensure_ascii=False)[1:-1]
+
+
+def test_prompt_functions_share_station_builder():
+    """Test that per-cell prompt calls at one station reuse a single builder."""
+    from chirality.core.prompts import _builder
+
+    prompt_multiply("", "Objectives", "r0", "c0", "a", "b")
+    hits = _builder.cache_info().hits
+    prompt_multiply("", "Objectives", "r0", "c1", "a", "c")
+    prompt_add("", "Objectives", "r1", "c0", ["p"])
+
+    assert _builder.cache_info().hits == hits + 2
+    assert set(_builder("", "Objectives")._labels) == {"r0", "r1", "c0", "c1"}
+
+
+def test_q_fast_path_matches_full_normalization():
+    """Test that the canonical-input fast path agrees with normalize-then-escape."""
+    import random
+    from chirality.core.prompts import q
+    from chirality.core._text import normalize_text, escape_json_string
+
+    rng = random.Random(22)
+    alphabet = [chr(c) for c in range(0x80)] + ["é", "“", " ", "ﬁ"]
+    for _ in range(2000):
+        s = "".join(rng.choice(alphabet if rng.random() < 0.3 else "ab c") for _ in range(rng.randint(0, 8)))
+        assert q(s) == escape_json_string(normalize_text(s))
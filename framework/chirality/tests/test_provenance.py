@@ -0,0 +1,194 @@
+"""Tests for CF14 provenance hashing."""
+
+import json
+
+import pytest
+
+from chirality.core.provenance import (
+    _dumps_canonical,
+    create_cell_provenance,
+    verify_provenance_integrity,
+    prompt_hash,
+)
+
+
+def test_dumps_canonical_matches_stdlib():
+    """Test that canonical bytes are stdlib json.dumps with sorted keys and default formatting."""
+    sample = {
+        "b": [1, 2.5, None, True],
+        "a": {"z": "ünïcode ✓", "y": "line\nbreak \"quoted\""},
+        "c": "",
+    }
+    expected = json.dumps(sample, sort_keys=True).encode("utf-8")
+
+    assert _dumps_canonical(sample) == expected
+    assert b'\\u00fcn\\u00efcode' in expected and b'"c": ""' in expected
+
+
+def test_dumps_canonical_floats_backend_independent():
+    """Test that floats and NaN encode as stdlib json does, even with orjson installed."""
+    sample = {"big": 1e16, "small": 1e-7, "nan": float("nan"), "inf": float("inf"), "x": 0.1}
+
+    assert _dumps_canonical(sample) == json.dumps(sample, sort_keys=True).encode("utf-8")
+    assert b'"big": 1e+16' in _dumps_canonical(sample)
+    assert b'"nan": NaN' in _dumps_canonical(sample)
+
+
+def test_dumps_canonical_non_str_keys():
+    """Test that non-str keys serialize like stdlib json."""
+    sample = {2: "two", 1: "one"}
+
+    assert _dumps_canonical(sample) == json.dumps(sample, sort_keys=True).encode("utf-8")
+
+
+def test_hashes_match_baseline_digests():
+    """Test that content, prompt and provenance hashes are unchanged from the original encoding."""
+    from chirality.core.provenance import ProvenanceTracker, canonical_value
+    from chirality.core.types import Cell, Matrix
+
+    values = {(0, 0): "alpha ✓", (0, 1): "beta", (1, 0): "  Zürich\tvalues ", (1, 1): ""}
+    cells = [Cell(id=f"A:{r}:{c}", row=r, col=c, value=v) for (r, c), v in reversed(values.items())]
+    matrix = Matrix(id="t:A:v1", name="A", station="problem", shape=(2, 2), cells=cells)
+    context = {"model": "gpt-4", "temperature": 0.5, "note": "café"}
+
+    assert matrix.hash == "eaecdf9ecfafb740"
+    assert prompt_hash("sys ✓", "user  prompt", context) == (
+        "43915a0fa999d9266d7e879601689aaa1f49c5a9186a7f2b81c8886e547c92fb"
+    )
+    assert ProvenanceTracker().generate_provenance_hash({"k": "ü", "n": [1, 2.5]}) == (
+        "c0fc8adf704e540d1adf664ff9d66b5d069d82ac6365471912117787fcd9f677"
+    )
+    assert canonical_value({"b": ["é", 1], "a": None}) == '{"a":null,"b":["\\u00e9",1]}'
+
+
+def test_prompt_hash_ignores_context_key_order():
+    """Test that prompt hashes are stable under context reordering."""
+    h1 = prompt_hash("sys", "user", {"a": 1, "b": 2})
+    h2 = prompt_hash("sys", "user", {"b": 2, "a": 1})
+
+    assert h1 == h2
+
+
+def test_cell_provenance_integrity():
+    """Test that provenance hashes verify and detect tampering."""
+    prov = create_cell_provenance("*", ["A:0:0", "B:0:0"], {"model": "gpt-4"})
+
+    assert verify_provenance_integrity(prov)
+
+    prov["sources"] = ["A:0:0"]
+    assert not verify_provenance_integrity(prov)
+
+
+def test_prompt_hash_reuses_system_state():
+    """Test that the primed system-prompt state does not leak between calls."""
+    import hashlib
+    from chirality.core.provenance import canonical_value, _dumps_canonical as dumps
+
+    first = prompt_hash("system  prompt", "user one", {})
+    second = prompt_hash("system  prompt", "user two", {})
+    expected = hashlib.sha256(
+        canonical_value("system  prompt").encode("utf-8") + b"\n\n"
+        + canonical_value("user two").encode("utf-8") + b"\n\n" + dumps({})
+    ).hexdigest()
+
+    assert first != second
+    assert second == expected
+
+
+def test_now_iso_matches_datetime_format():
+    """Test that the fast timestamp parses like datetime.utcnow().isoformat()."""
+    from datetime import datetime, timedelta
+    from chirality.core.provenance import _now_iso
+
+    before = datetime.utcnow()
+    stamp = _now_iso()
+    after = datetime.utcnow()
+
+    parsed = datetime.fromisoformat(stamp)
+    assert before - timedelta(milliseconds=1) <= parsed <= after
+    assert parsed.isoformat() == stamp
+
+
+def test_record_hash_distinguishes_field_shapes():
+    """Test that a string field and a one-element list field hash differently."""
+    from chirality.core.provenance import _record_hash
+
+    assert _record_hash({"sources": "a"}) != _record_hash({"sources": ["a"]})
+    assert _record_hash({"sources": ["a", "b"]}) != _record_hash({"sources": ["b", "a"]})
+    assert _record_hash({"x": "1", "hash": "ignored"}) == _record_hash({"x": "1"})
+
+
+def test_record_hash_no_separator_collisions():
+    """Test that field contents cannot mimic field or list-item boundaries."""
+    from chirality.core.provenance import _record_hash
+
+    assert _record_hash({"a": "x\x1eb\0sy"}) != _record_hash({"a": "x", "b": "y"})
+    assert _record_hash({"a": "x1:bs1:y"}) != _record_hash({"a": "x", "b": "y"})
+    assert _record_hash({"s": ["a\x1fb"]}) != _record_hash({"s": ["a", "b"]})
+    assert _record_hash({"s": ["1:a"]}) != _record_hash({"s": ["", "a"]})
+    assert _record_hash({"s": [""]}) != _record_hash({"s": []})
+    assert _record_hash({"s": "1"}) != _record_hash({"s": 1})
+
+
+def test_merge_provenance_sources_ordered_union():
+    """Test that merged sources keep first-seen order without duplicates."""
+    from chirality.core.provenance import merge_provenance
+
+    merged = merge_provenance({"sources": ["b", "a"]}, {"sources": ["a", "c", "b"]})
+
+    assert merged["sources"] == ["b", "a", "c"]
+    assert verify_provenance_integrity(merged)
+
+
+def test_tracker_records_and_lineage():
+    """Test that tracked operations materialize as records with lineage."""
+    from chirality.core.provenance import ProvenanceTracker
+
+    tracker = ProvenanceTracker()
+    first = tracker.track_operation("*", ["A", "B"], ["C"], {"station": "requirements"})
+    second = tracker.track_operation("+", ["C", "F"], ["D", "E"])
+
+    ops = tracker.operations
+    assert [op["id"] for op in ops] == [first, second]
+    assert ops[0]["inputs"] == ["A", "B"] and ops[0]["metadata"] == {"station": "requirements"}
+    assert ops[1]["outputs"] == ["D", "E"] and ops[1]["metadata"] == {}
+    assert tracker.lineage["E"] == {"operation": second, "sources": ["C", "F"], "timestamp": ops[1]["timestamp"]}
+
+    tree = tracker.get_lineage("D", depth=2)
+    assert tree["lineage"]["sources"][0]["lineage"]["operation"] == first
+    assert tree["lineage"]["sources"][1] == {"id": "F", "lineage": None}
+
+    exported = tracker.export_provenance()
+    assert exported["operations"] == list(ops) and set(exported["lineage"]) == {"C", "D", "E"}
+    json.dumps(exported)
+
+
+def test_tracker_views_reject_mutation():
+    """Test that operations and lineage raise on mutation instead of editing a copy."""
+    from chirality.core.provenance import ProvenanceTracker
+
+    tracker = ProvenanceTracker()
+    tracker.track_operation("*", ["A", "B"], ["C"])
+
+    with pytest.raises(AttributeError):
+        tracker.operations.append({"id": "op_x"})
+    with pytest.raises(TypeError):
+        tracker.lineage["X"] = {"operation": "op_x"}
+    assert len(tracker.operations) == 1 and "X" not in tracker.lineage
+
+
+def test_tracker_track_bulk_shares_timestamp():
+    """Test that track_bulk records every operation under one timestamp."""
+    from chirality.core.provenance import ProvenanceTracker
+
+    tracker = ProvenanceTracker()
+    op_ids = tracker.track_bulk([
+        {"operation_type": "*", "inputs": ["A", "B"], "outputs": ["C"]},
+        {"operation_type": "+", "inputs": ["A", "F"], "outputs": ["D"], "metadata": {"station": "S3"}},
+    ])
+
+    ops = tracker.operations
+    assert [op["id"] for op in ops] == op_ids
+    assert ops[0]["timestamp"] == ops[1]["timestamp"]
+    assert ops[1]["metadata"] == {"station": "S3"}
+    assert tracker.get_lineage("D")["lineage"]["sources"] == ["A", "F"]
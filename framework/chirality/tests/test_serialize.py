@@ -0,0 +1,108 @@
+"""Tests for CF14 matrix serialization."""
+
+import pytest
+from chirality.core.serialize import (
+    save_matrix,
+    load_matrix,
+    save_matrix_binary,
+    load_matrix_binary,
+    export_pipeline_results,
+    matrix_to_json,
+)
+from chirality.core.types import Modality
+from chirality.tests.test_types import create_test_matrix
+
+
+def test_json_file_round_trip(tmp_path):
+    """Test that a matrix survives save_matrix/load_matrix unchanged."""
+    matrix = create_test_matrix()
+    matrix.metadata["note"] = "ünïcode ✓"
+    path = tmp_path / "matrix.json"
+
+    save_matrix(matrix, path)
+
+    assert load_matrix(path) == matrix
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_matrix_to_json_same_bytes_without_orjson(monkeypatch, indent):
+    """Test that the stdlib fallback matches orjson's output format."""
+    from chirality.core import serialize
+
+    pytest.importorskip("orjson")
+    matrix = create_test_matrix()
+    matrix.metadata["note"] = "ünïcode ✓"
+
+    with_orjson = matrix_to_json(matrix, indent=indent)
+    monkeypatch.setattr(serialize, "orjson", None)
+
+    assert matrix_to_json(matrix, indent=indent) == with_orjson
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_non_finite_round_trip(monkeypatch, tmp_path, use_orjson):
+    """Test that NaN and Infinity survive save/load whether or not orjson is installed."""
+    import json
+    import math
+    from chirality.core import serialize
+    from chirality.core.serialize import matrix_from_json
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialize, "orjson", None)
+    matrix = create_test_matrix()
+    matrix.cells[0].provenance = {"score": float("nan"), "bound": float("inf")}
+    path = tmp_path / "matrix.json"
+
+    save_matrix(matrix, path)
+    loaded = load_matrix(path)
+    # Payloads written by plain json.dumps load too
+    from_stdlib = matrix_from_json(json.dumps(matrix.to_dict()))
+
+    for result in (loaded, from_stdlib):
+        provenance = result.cells[0].provenance
+        assert math.isnan(provenance["score"]) and provenance["bound"] == float("inf")
+
+
+def test_binary_archive_round_trip(tmp_path):
+    """Test that the msgpack archive restores every matrix and cell field."""
+    pytest.importorskip("msgpack")
+    matrix = create_test_matrix(shape=(3, 2))
+    matrix.cells[1].modality = Modality.THEORY
+    matrix.cells[2].provenance = {"operation": "*", "sources": ["A:0:0"]}
+    path = tmp_path / "matrix.msgpack"
+
+    save_matrix_binary(matrix, path)
+
+    assert load_matrix_binary(path) == matrix
+
+
+def test_export_pipeline_results_binary(tmp_path):
+    """Test that binary export writes an archive next to each JSON file."""
+    pytest.importorskip("msgpack")
+    matrix = create_test_matrix()
+
+    paths = export_pipeline_results({"A": matrix}, tmp_path, binary=True)
+
+    assert load_matrix(paths["A"]) == matrix
+    assert load_matrix_binary(paths["A_msgpack"]) == matrix
+
+
+def test_export_pipeline_results_writes_all(tmp_path):
+    """Test that every matrix is written and paths keep result order."""
+    matrices = {name: create_test_matrix(name) for name in ["A", "B", "C", "D"]}
+
+    paths = export_pipeline_results(matrices, tmp_path)
+
+    assert list(paths) == ["A", "B", "C", "D", "summary"]
+    for name, matrix in matrices.items():
+        assert load_matrix(paths[name]) == matrix
+    assert "CF14 Pipeline Results" in open(paths["summary"], encoding="utf-8").read()
+
+
+def test_export_pipeline_results_empty(tmp_path):
+    """Test that exporting no matrices still writes the summary."""
+    paths = export_pipeline_results({}, tmp_path)
+
+    assert list(paths) == ["summary"]
@@ -0,0 +1,54 @@
+"""Tests for CF14 station runners."""
+
+from chirality.core.types import Matrix, Cell
+from chirality.core.ops import EchoResolver
+from chirality.core.ids import generate_cell_id
+from chirality.core.stations import S3Runner
+from chirality.core.provenance import verify_provenance_integrity
+
+
+def create_c_matrix():
+    """Create a small C matrix with one long cell value."""
+    values = ["short", "x" * 80, "third", "fourth"]
+    cells = [
+        Cell(id=f"C:{i // 2}:{i % 2}", row=i // 2, col=i % 2, value=v)
+        for i, v in enumerate(values)
+    ]
+    return Matrix(id="t:C:v1", name="C", station="requirements", shape=(2, 2), cells=cells)
+
+
+def test_s3_derived_matrices():
+    """Test that the F/D fallbacks label, truncate and stamp C's cells."""
+    runner = S3Runner(EchoResolver())
+    matrix_c = create_c_matrix()
+
+    for method, name, label, operation in (
+        (runner._generate_function_matrix, "F", "Function: ", "extract_function"),
+        (runner._generate_domain_matrix, "D", "Domain: ", "map_domain"),
+    ):
+        derived = method(matrix_c, "t", {})
+
+        assert derived.name == name
+        assert derived.shape == matrix_c.shape
+        assert [c.value for c in derived.cells] == [label + c.value[:50] for c in matrix_c.cells]
+        assert {c.provenance["timestamp"] for c in derived.cells} == {derived.cells[0].provenance["timestamp"]}
+
+        for cell, source in zip(derived.cells, matrix_c.cells):
+            assert cell.id == generate_cell_id(derived.id, cell.row, cell.col, {"text": cell.value})
+            assert cell.provenance["operation"] == operation
+            assert cell.provenance["sources"] == [source.id]
+            assert verify_provenance_integrity(cell.provenance)
+
+
+def test_s3_derived_cell_ids_memoized():
+    """Test that regenerating a derived matrix reuses cached cell IDs."""
+    from chirality.core.stations import _cell_id
+
+    runner = S3Runner(EchoResolver())
+    matrix_c = create_c_matrix()
+    first = runner._generate_function_matrix(matrix_c, "memo", {})
+    hits = _cell_id.cache_info().hits
+    second = runner._generate_function_matrix(matrix_c, "memo", {})
+
+    assert [c.id for c in second.cells] == [c.id for c in first.cells]
+    assert _cell_id.cache_info().hits == hits + len(matrix_c.cells)
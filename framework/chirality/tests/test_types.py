@@ -0,0 +1,88 @@
+"""Tests for CF14 core types."""
+
+from chirality.core.types import Matrix, Cell, Modality
+from chirality.core.provenance import content_hash
+
+
+def create_test_matrix(name: str = "A", shape: tuple = (2, 2)):
+    """Create a small test matrix."""
+    cells = [
+        Cell(id=f"{name}:{r}:{c}", row=r, col=c, value=f"v_{r}_{c}", modality=Modality.AXIOM)
+        for r in range(shape[0])
+        for c in range(shape[1])
+    ]
+    return Matrix(
+        id=name,
+        name=name,
+        station="test",
+        shape=shape,
+        cells=cells,
+        hash="test_hash",
+        metadata={}
+    )
+
+
+def test_matrix_to_dict_legacy_keys():
+    """Test that legacy keys are emitted by default."""
+    data = create_test_matrix().to_dict()
+
+    assert data["type"] == "A"
+    assert data["dimensions"] == [2, 2]
+    assert data["cells"][0]["content"] == {"text": "v_0_0"}
+
+
+def test_matrix_to_dict_without_legacy_keys():
+    """Test that include_legacy=False omits legacy keys everywhere."""
+    data = create_test_matrix().to_dict(include_legacy=False)
+
+    assert "type" not in data
+    assert "dimensions" not in data
+    assert all("content" not in cell for cell in data["cells"])
+
+
+def test_matrix_round_trip():
+    """Test that from_dict restores what to_dict emitted."""
+    matrix = create_test_matrix()
+
+    for include_legacy in (True, False):
+        restored = Matrix.from_dict(matrix.to_dict(include_legacy=include_legacy))
+        assert restored == matrix
+
+
+def test_cell_from_dict_legacy_content():
+    """Test that legacy content-only cells still deserialize."""
+    cell = Cell.from_dict({"id": "x", "row": 0, "col": 1, "content": {"text": "legacy"}})
+
+    assert cell.value == "legacy"
+    assert cell.modality == Modality.UNKNOWN
+
+
+def test_null_provenance_same_on_both_cell_paths():
+    """Test that "provenance": null reads as {} whether or not every cell has "value"."""
+    canonical = {"id": "a", "row": 0, "col": 0, "value": "x", "provenance": None}
+    legacy = {"id": "b", "row": 0, "col": 1, "content": {"text": "y"}, "provenance": None}
+    data = {"id": "m", "name": "A", "station": "problem", "shape": [1, 2]}
+
+    fast = Matrix.from_dict({**data, "cells": [canonical, {**canonical, "id": "b", "col": 1}]})
+    mixed = Matrix.from_dict({**data, "cells": [canonical, legacy]})
+
+    assert [c.provenance for c in fast.cells] == [{}, {}]
+    assert [c.provenance for c in mixed.cells] == [{}, {}]
+
+
+def test_matrix_hash_computed_lazily():
+    """Test that an omitted hash is derived from the cells on first access."""
+    matrix = create_test_matrix()
+    lazy = Matrix(id="A", name="A", station="test", shape=(2, 2), cells=matrix.cells)
+
+    assert lazy.__dict__["_hash"] is None
+    assert lazy.hash == content_hash(matrix.cells)
+    assert lazy.__dict__["_hash"] == lazy.hash
+
+
+def test_matrix_hash_explicit_value_preserved():
+    """Test that an explicit hash survives construction and round-trip."""
+    matrix = create_test_matrix()
+
+    assert matrix.hash == "test_hash"
+    assert Matrix.from_dict(matrix.to_dict()).hash == "test_hash"
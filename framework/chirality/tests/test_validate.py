@@ -1,8 +1,11 @@
 """Tests for CF14 validation."""
 
 import pytest
-from chirality.core.types import Matrix, Cell
-from chirality.core.validate import ensure_dims, CF14ValidationError
+from chirality.core.types import Matrix, Cell, Modality
+from chirality.core.validate import (
+    ensure_dims, validate_matrix, validate_matrix_dimensions, validate_modality_alignment,
+    CF14ValidationError
+)
 
 
 def create_matrix(name: str, shape: tuple):
@@ -18,6 +21,16 @@ def create_matrix(name: str, shape: tuple):
     )
 
 
+def create_filled_matrix(name: str = "A", shape: tuple = (2, 3)):
+    """Create a matrix with one cell per position."""
+    cells = [
+        Cell(id=f"{name}:{r}:{c}", row=r, col=c, value=f"v_{r}_{c}")
+        for r in range(shape[0])
+        for c in range(shape[1])
+    ]
+    return Matrix(id=name, name=name, station="test", shape=shape, cells=cells)
+
+
 def test_ensure_dims_multiply_valid():
     """Test valid dimensions for multiplication."""
     A = create_matrix("A", (3, 4))
@@ -54,6 +67,22 @@ def test_ensure_dims_elementwise_invalid():
         ensure_dims(A, B, "⊙")
 
 
+@pytest.mark.parametrize("op, b_shape, message", [
+    ("*", (4, 2), "Matrix multiplication requires A.cols == B.rows, got (2, 3) × (4, 2)"),
+    ("multiply", (2, 2), "Matrix multiplication requires A.cols == B.rows, got (2, 3) × (2, 2)"),
+    ("⊙", (3, 2), "Operation ⊙ requires same dimensions, got (2, 3) vs (3, 2)"),
+    ("add", (2, 2), "Operation add requires same dimensions, got (2, 3) vs (2, 2)"),
+])
+def test_ensure_dims_messages(op, b_shape, message):
+    """Test the error message for each operation form."""
+    A = create_matrix("A", (2, 3))
+    B = create_matrix("B", b_shape)
+    
+    with pytest.raises(CF14ValidationError) as excinfo:
+        ensure_dims(A, B, op)
+    assert str(excinfo.value) == message
+
+
 def test_ensure_dims_addition_valid():
     """Test valid dimensions for addition."""
     A = create_matrix("A", (2, 2))
@@ -77,4 +106,110 @@ def test_cf14_validation_error():
     with pytest.raises(CF14ValidationError) as exc_info:
         raise CF14ValidationError("Test error message")
     
-    assert "Test error message" in str(exc_info.value)
\ No newline at end of file
+    assert "Test error message" in str(exc_info.value)
+
+def test_validate_matrix_valid():
+    """Test that a well-formed matrix has no errors."""
+    assert validate_matrix(create_filled_matrix()) == []
+
+
+def test_validate_matrix_reports_cell_errors():
+    """Test that bad cells still get detailed per-cell messages."""
+    matrix = create_filled_matrix()
+    matrix.cells[1].row = 5
+    matrix.cells[2].row, matrix.cells[2].col = 0, 0
+    matrix.cells[3].id = ""
+
+    errors = validate_matrix(matrix)
+
+    assert "Cell A:0:1 out of bounds: (5, 1)" in errors
+    assert "Duplicate cell at position (0, 0)" in errors
+    assert "Cell : Cell missing ID" in errors
+
+
+def test_validate_matrix_fast_stops_at_first_error():
+    """Test that fast mode returns only the first error found."""
+    matrix = create_filled_matrix()
+    matrix.cells[1].row = 5
+    matrix.cells[3].id = ""
+
+    assert len(validate_matrix(matrix)) > 1
+    assert validate_matrix(matrix, fast=True) == ["Cell A:0:1 out of bounds: (5, 1)"]
+    assert validate_matrix(create_filled_matrix(), fast=True) == []
+
+
+def test_validate_matrix_cached_until_invalidated():
+    """Test that a validated matrix is skipped until invalidate() is called."""
+    matrix = create_filled_matrix()
+    assert validate_matrix(matrix) == []
+    assert matrix._validated
+
+    matrix.cells[0].row = 9
+    assert validate_matrix(matrix) == []
+
+    matrix.invalidate()
+    assert validate_matrix(matrix) == ["Cell A:0:0 out of bounds: (9, 0)"]
+    assert not matrix._validated
+
+
+def test_validate_matrix_invalid_type_and_modality():
+    """Test that unknown names and modalities are reported, not raised."""
+    matrix = create_filled_matrix("X")
+    matrix.cells[0].modality = "bogus"
+
+    errors = validate_matrix(matrix)
+
+    assert "Invalid matrix type: X" in errors
+    assert "Cell X:0:0: Invalid modality: bogus" in errors
+    assert validate_matrix(create_filled_matrix("J")) == []
+
+
+def test_validate_modality_alignment():
+    """Test the axiom/instance and value/theory alignment rules."""
+    def with_modalities(name, *modalities):
+        matrix = create_filled_matrix(name, (1, 3))
+        for cell, modality in zip(matrix.cells, modalities):
+            cell.modality = modality
+        return matrix
+
+    A = with_modalities("A", Modality.AXIOM, Modality.VALUE, Modality.AXIOM)
+    B = with_modalities("B", Modality.CONCEPT, Modality.THEORY, Modality.INSTANCE)
+
+    assert validate_modality_alignment(A, B) == [
+        "Cannot multiply axioms with instances directly",
+        "Cannot multiply values with theories directly",
+    ]
+    assert validate_modality_alignment(with_modalities("A", Modality.VALUE), B) == [
+        "Cannot multiply values with theories directly",
+    ]
+    assert validate_modality_alignment(with_modalities("A", Modality.CONCEPT), B) == []
+
+
+def test_validate_matrix_dimensions_matches_ensure_dims():
+    """Test that word and symbol operation names share one rule."""
+    A = create_matrix("A", (2, 3))
+    B = create_matrix("B", (2, 3))
+
+    assert validate_matrix_dimensions(A, B, "multiply") == [
+        "Incompatible dimensions for multiplication: (2, 3) × (2, 3)"
+    ]
+    assert validate_matrix_dimensions(A, B, "*") == validate_matrix_dimensions(A, B, "multiply")
+    assert validate_matrix_dimensions(A, B, "add") == []
+    assert validate_matrix_dimensions(A, create_matrix("F", (3, 3)), "add") == [
+        "Incompatible dimensions for addition: (2, 3) vs (3, 3)"
+    ]
+    assert validate_matrix_dimensions(A, B, "interpret") == []
+
+    with pytest.raises(CF14ValidationError):
+        ensure_dims(A, B, "multiply")
+
+
+def test_validate_matrix_duplicates_on_huge_sparse_grid():
+    """Test duplicate detection when the grid is too large for a bitmap."""
+    matrix = create_filled_matrix()
+    matrix.shape = (1 << 13, 1 << 13)
+    assert validate_matrix(matrix) == []
+
+    matrix.cells[1].col = 0
+    matrix.invalidate()
+    assert validate_matrix(matrix) == ["Duplicate cell at position (0, 0)"]
@@ -2,11 +2,41 @@
 Setup configuration for Backend Framework (generic template).
 """
 
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optional compiled build. Cython must be importable when this file runs, and
+# pip's isolated build environment would not have it, so install it first:
+#   pip install "cython>=3.0.0" setuptools wheel
+#   CF14_ENABLE_CYTHON=1 pip install --no-build-isolation .
+# The pure-Python sources stay authoritative; .pxd files only add C types.
+ext_modules = []
+if os.environ.get("CF14_ENABLE_CYTHON") == "1":
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        raise SystemExit(
+            "CF14_ENABLE_CYTHON=1 requires Cython in the build environment: "
+            'pip install "cython>=3.0.0" setuptools wheel, then pip install --no-build-isolation .'
+        )
+
+    ext_modules = cythonize(
+        [
+            "chirality/core/_echo.pyx",
+            "chirality/core/ops.py",
+            "chirality/core/stations.py",
+            "chirality/core/types.py",
+            "chirality/core/validate.py",
+        ],
+        # Type hints in the .py sources are documentation, not C types: without
+        # this, Cython would reject str/list subclasses wherever they're annotated
+        compiler_directives={"language_level": "3", "annotation_typing": False},
+    )
+
 setup(
     name="chirality-framework",
     version="14.3.1",
@@ -39,6 +69,21 @@ setup(
         "neo4j": [
             "neo4j>=5.0.0",
         ],
+        "orjson": [
+            "orjson>=3.9.0",
+        ],
+        "msgpack": [
+            "msgpack>=1.0.0",
+        ],
+        "numpy": [
+            "numpy>=1.24.0",
+        ],
+        "numba": [
+            "numba>=0.58.0",
+        ],
+        "cython": [
+            "cython>=3.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -52,6 +97,7 @@ setup(
         ],
     },
     package_data={
-        "chirality": ["*.txt", "*.json", "tests/fixtures/*.json"],
+        "chirality": ["*.txt", "*.json", "core/*.pxd", "tests/fixtures/*.json"],
     },
+    ext_modules=ext_modules,
 )